@@ -25,6 +25,8 @@ TTSVoice = Literal["alloy", "ash", "ballad", "coral", "echo", "fable", "nova", "
 
 # ---------- TTS providers ----------
 TTSProviderName = Literal["openai", "elevenlabs"]
+# "pcm" is OpenAI's raw response_format: 16-bit little-endian mono at 24kHz.
+TTSAudioFormat = Literal["mp3", "pcm"]
 ElevenLabsModel = Literal["eleven_v3", "eleven_multilingual_v2", "eleven_flash_v2_5", "eleven_turbo_v2_5"]
 
 DEFAULT_TTS_PROVIDER: TTSProviderName = "openai"
@@ -60,6 +62,16 @@ ELEVENLABS_DEFAULT_CONCURRENCY: dict[ElevenLabsModel, int] = {
     "eleven_turbo_v2_5": 4,
 }
 
+# OpenAI TTS has no documented concurrency cap, only RPM/TPM budgets, but an
+# unbounded fan-out over a long script fires every segment at once and spends
+# the first minute on 429 retries. 8 in flight keeps low tiers under their RPM
+# while staying well past the point where more parallelism stops helping.
+# SANZARU_OPENAI_MAX_CONCURRENCY overrides it (0 = unbounded).
+OPENAI_DEFAULT_CONCURRENCY = 8
+
+# Fixed by the API for response_format="pcm"; not configurable per request.
+OPENAI_PCM_SAMPLE_RATE = 24000
+
 # 44.1kHz/128kbps mp3 is available on every tier (192k requires Creator+), and
 # mp3 keeps the podcast stitch path's AudioSegment.from_mp3 contract intact.
 ELEVENLABS_OUTPUT_FORMAT = "mp3_44100_128"
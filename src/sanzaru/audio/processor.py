@@ -87,7 +87,7 @@ class AudioProcessor:
         """
         try:
             original_frame_rate = audio_data.frame_rate
-            logger.debug(f"Compressing audio: {original_frame_rate}Hz → {target_sample_rate}Hz")
+            logger.debug("Compressing audio: %sHz → %sHz", original_frame_rate, target_sample_rate)
 
             await anyio.to_thread.run_sync(
                 lambda: audio_data.export(
@@ -2,12 +2,14 @@
 """Provider-neutral TTS request/response contract and the chunking orchestrator.
 
 Division of labour: a provider synthesizes **one chunk** of text and returns mp3
-bytes. Everything above that — splitting long text, bounded parallel fan-out,
+bytes (or raw PCM, when a request opts in). Everything above that — splitting long text, bounded parallel fan-out,
 concatenation — lives in `synthesize_speech` here, so both TTS call sites
 (`TTSService.create_speech` and `generate_podcast`) share one implementation.
 
 mp3 is the contract, not an implementation detail: the podcast stitcher decodes
-every segment with `AudioSegment.from_mp3`.
+every segment with `AudioSegment.from_mp3`. The one exception is
+`SpeechRequest.audio_format="pcm"`, which only the OpenAI provider honours and
+only the podcast stitcher asks for — it has no mp3 to decode at all.
 """
 
 import os
@@ -18,7 +20,8 @@ from typing import Protocol, TypedDict, runtime_checkable
 import anyio
 
 from ...config import logger
-from ..constants import TTSProviderName
+from ..constants import TTSAudioFormat, TTSProviderName
+from .cache import read_cached, write_cached
 
 
 class VoiceSettingsDict(TypedDict, total=False):
@@ -89,6 +92,9 @@ class SpeechRequest:
     """Preceding text, for cross-chunk prosody continuity. ElevenLabs-only."""
     next_text: str | None = None
     """Following text, for cross-chunk prosody continuity. ElevenLabs-only."""
+    audio_format: TTSAudioFormat = "mp3"
+    """Encoding of the returned bytes. "pcm" (raw 24kHz 16-bit mono) is
+    OpenAI-only and lets the podcast stitcher skip an mp3 decode per segment."""
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,7 +106,8 @@ class DialogueTurn:
 
 
 class TTSProvider(Protocol):
-    """A text-to-speech backend. Implementations must return mp3 bytes."""
+    """A text-to-speech backend. Implementations return mp3 bytes unless the
+    request's `audio_format` asks for PCM and the provider supports it."""
 
     name: TTSProviderName
     supports_dialogue: bool
@@ -128,7 +135,7 @@ class TTSProvider(Protocol):
         ...
 
     async def synthesize_chunk(self, request: SpeechRequest) -> bytes:
-        """Synthesize one chunk of text into mp3 bytes."""
+        """Synthesize one chunk of text into bytes of `request.audio_format`."""
         ...
 
 
@@ -194,7 +201,7 @@ async def synthesize_speech(
     *,
     limiter: anyio.CapacityLimiter | None = None,
 ) -> bytes:
-    """Synthesize `request` into mp3 bytes, splitting text the provider can't take at once.
+    """Synthesize `request` into audio, splitting text the provider can't take at once.
 
     Args:
         provider: Backend to synthesize with.
@@ -204,7 +211,7 @@ async def synthesize_speech(
             created inside the running event loop — CapacityLimiter is loop-bound.
 
     Returns:
-        mp3 bytes.
+        Audio bytes in `request.audio_format` (mp3 unless PCM was asked for).
     """
     provider.validate(request)
 
@@ -238,9 +245,13 @@ async def synthesize_speech(
     # Read by index, not completion order — chunk order is the audio order.
     audio_chunks = [capture.result() for capture in captures]
 
+    if request.audio_format == "pcm":
+        # Headerless PCM concatenates byte-for-byte; no decode/re-encode.
+        return b"".join(audio_chunks)
+
     from ..processor import AudioProcessor
 
-    return await AudioProcessor().concatenate_audio_segments(audio_chunks, format="mp3")
+    return await AudioProcessor.concatenate_audio_segments(audio_chunks, format="mp3")
 
 
 async def _synthesize_one(
@@ -248,7 +259,14 @@ async def _synthesize_one(
     request: SpeechRequest,
     limiter: anyio.CapacityLimiter | None,
 ) -> bytes:
+    # Checked before the limiter: a cache hit must not wait on a request slot.
+    cached = await read_cached(provider.name, request)
+    if cached is not None:
+        return cached
     if limiter is None:
-        return await provider.synthesize_chunk(request)
-    async with limiter:
-        return await provider.synthesize_chunk(request)
+        audio = await provider.synthesize_chunk(request)
+    else:
+        async with limiter:
+            audio = await provider.synthesize_chunk(request)
+    await write_cached(provider.name, request, audio)
+    return audio
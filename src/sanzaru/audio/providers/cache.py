@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT
+"""Opt-in on-disk cache for synthesized TTS chunks.
+
+Set ``SANZARU_TTS_CACHE_DIR`` to a directory and every chunk `synthesize_speech`
+renders is stored there, content-addressed by the provider name plus every
+field of its `SpeechRequest`. Re-rendering an episode — or any intro, outro or
+catchphrase repeated across episodes — then reads the stored audio from disk
+instead of paying for another API round trip.
+
+Off by default: TTS output is not deterministic, and a user regenerating a
+line usually wants a fresh take, not the cached one.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+import anyio
+
+from ...config import logger
+
+if TYPE_CHECKING:
+    from .base import SpeechRequest
+
+TTS_CACHE_DIR_ENV = "SANZARU_TTS_CACHE_DIR"
+
+
+def _cache_dir() -> pathlib.Path | None:
+    raw = os.getenv(TTS_CACHE_DIR_ENV, "").strip()
+    return pathlib.Path(raw).expanduser() if raw else None
+
+
+def cache_key(provider_name: str, request: "SpeechRequest") -> str:
+    """SHA-256 over the provider and every request field, including chunk context.
+
+    previous_text/next_text are part of the key because ElevenLabs shapes
+    prosody from them: the same chunk text in a different context is a
+    different rendering.
+
+    Whitespace in the text fields is stripped and collapsed for the key only,
+    so a line re-typed with different spacing still hits. The request sent to
+    the provider is untouched.
+    """
+    fields = asdict(request)
+    for name in ("text", "previous_text", "next_text"):
+        if fields[name] is not None:
+            fields[name] = " ".join(fields[name].split())
+    payload = json.dumps([provider_name, fields], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _entry(root: pathlib.Path, key: str, request: "SpeechRequest") -> pathlib.Path:
+    # Two-character fan-out keeps any one directory small.
+    return root / key[:2] / f"{key}.{request.audio_format}"
+
+
+def _read(path: pathlib.Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.warning("Could not read TTS cache entry %s: %s", path, exc)
+        return None
+
+
+def _write(path: pathlib.Path, audio: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a concurrent reader never sees a partial entry.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio)
+        os.replace(tmp, path)
+    except BaseException:
+        pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+async def read_cached(provider_name: str, request: "SpeechRequest") -> bytes | None:
+    """Cached audio for this request, or None on a miss or when the cache is off."""
+    root = _cache_dir()
+    if root is None:
+        return None
+    audio = await anyio.to_thread.run_sync(_read, _entry(root, cache_key(provider_name, request), request))
+    if audio is not None:
+        logger.debug("TTS cache hit (%s, %d chars)", provider_name, len(request.text))
+    return audio
+
+
+async def write_cached(provider_name: str, request: "SpeechRequest", audio: bytes) -> None:
+    """Store a rendered chunk. A failing cache is logged, never fatal to the render."""
+    root = _cache_dir()
+    if root is None:
+        return
+    try:
+        await anyio.to_thread.run_sync(_write, _entry(root, cache_key(provider_name, request), request), audio)
+    except OSError as exc:
+        logger.warning("Could not write TTS cache entry under %s: %s", root, exc)
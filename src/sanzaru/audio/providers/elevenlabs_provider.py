@@ -81,6 +81,8 @@ class ElevenLabsTTSProvider:
         return env_concurrency("SANZARU_ELEVENLABS_MAX_CONCURRENCY", default)
 
     def validate(self, request: SpeechRequest) -> None:
+        if request.audio_format != "mp3":
+            raise ValueError(f"audio_format={request.audio_format!r} is OpenAI-only; provider='elevenlabs' returns mp3")
         if request.model not in _MODELS:
             raise ValueError(
                 f"model={request.model!r} is not an ElevenLabs model; choose one of: {', '.join(ELEVENLABS_MODELS)}"
@@ -1,16 +1,21 @@
 # SPDX-License-Identifier: MIT
 """OpenAI text-to-speech provider (client.audio.speech)."""
 
+import re
+import time
+from collections.abc import Mapping
 from typing import cast, get_args
 
+import anyio
 from openai._types import Omit, omit
 from openai.types.audio.speech_model import SpeechModel
 
-from ...config import get_client
+from ...config import get_client, logger
 from ..constants import (
     DEFAULT_OPENAI_TTS_MODEL,
     DEFAULT_OPENAI_VOICE,
     DEFAULT_TTS_MAX_LENGTH,
+    OPENAI_DEFAULT_CONCURRENCY,
     OPENAI_SPEED_RANGE,
     OPENAI_TTS_MODELS,
     TTSProviderName,
@@ -20,9 +25,55 @@ from .base import SpeechRequest, env_concurrency
 
 _VOICES: tuple[str, ...] = get_args(TTSVoice)
 
+# "6m0s", "1.5s", "20ms" - the format of OpenAI's x-ratelimit-reset-* headers.
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_reset(value: object) -> float | None:
+    """Seconds from an x-ratelimit-reset-* header, or None if absent/unparseable."""
+    if not isinstance(value, str):
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class _RateLimitWindow:
+    """Holds new requests back once OpenAI reports the current window is spent.
+
+    Every response carries x-ratelimit-remaining-{requests,tokens} and the time
+    until each resets. When either hits zero, the next request would be a 429
+    the SDK then sleeps off, so callers wait out the reset up front instead.
+    Module-level, so every podcast and speech call on this process shares one
+    view of the account's budget. Uses only the clock (not a CapacityLimiter),
+    so it is not bound to any one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    async def wait(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            logger.info("OpenAI rate-limit window exhausted - waiting %.1fs for it to reset", delay)
+            await anyio.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        for kind in ("requests", "tokens"):
+            if headers.get(f"x-ratelimit-remaining-{kind}") != "0":
+                continue
+            reset = _parse_reset(headers.get(f"x-ratelimit-reset-{kind}"))
+            if reset:
+                self._resume_at = max(self._resume_at, time.monotonic() + reset)
+
+
+_RATE_LIMIT_WINDOW = _RateLimitWindow()
+
 
 class OpenAITTSProvider:
-    """Speech via OpenAI's `client.audio.speech.create`, always as mp3."""
+    """Speech via OpenAI's `client.audio.speech.create`, as mp3 or raw PCM."""
 
     name: TTSProviderName = "openai"
     # No multi-speaker endpoint; dialogue runs fall back to per-segment rendering.
@@ -42,8 +93,8 @@ class OpenAITTSProvider:
         return DEFAULT_TTS_MAX_LENGTH
 
     def max_concurrency(self, model: str) -> int:
-        # 0 == unbounded, which is the historical behavior of the podcast fan-out.
-        return env_concurrency("SANZARU_OPENAI_MAX_CONCURRENCY", 0)
+        # 429s beyond this are retried by the SDK itself, honoring Retry-After.
+        return env_concurrency("SANZARU_OPENAI_MAX_CONCURRENCY", OPENAI_DEFAULT_CONCURRENCY)
 
     def validate(self, request: SpeechRequest) -> None:
         low, high = OPENAI_SPEED_RANGE
@@ -53,8 +104,6 @@ class OpenAITTSProvider:
             raise ValueError("voice_settings is an ElevenLabs-only option; provider='openai' does not accept it")
         if request.voice not in _VOICES:
             # A warning, not an error: OpenAI adds voices between our releases.
-            from ...config import logger
-
             logger.warning(
                 "voice=%r is not a known OpenAI voice (expected one of: %s)", request.voice, ", ".join(_VOICES)
             )
@@ -62,14 +111,16 @@ class OpenAITTSProvider:
     async def synthesize_chunk(self, request: SpeechRequest) -> bytes:
         client = get_client()
         instructions: str | Omit = omit if request.instructions is None else request.instructions
+        await _RATE_LIMIT_WINDOW.wait()
         response = await client.audio.speech.create(
             input=request.text,
             model=cast(SpeechModel, request.model),
             voice=cast(TTSVoice, request.voice),
             speed=request.speed,
             instructions=instructions,
-            response_format="mp3",
+            response_format=request.audio_format,
         )
+        _RATE_LIMIT_WINDOW.update(response.response.headers)
         return response.content
 
 
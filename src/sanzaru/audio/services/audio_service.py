@@ -86,7 +86,7 @@ class AudioService:
         if not needs_compression:
             return AudioProcessingResult(output_file=input_filename)  # No compression needed
 
-        logger.info(f"File '{input_filename}' size > {max_mb}MB. Attempting compression...")
+        logger.info("File '%s' size > %sMB. Attempting compression...", input_filename, max_mb)
 
         # Convert to MP3 if not already
         if not input_filename.lower().endswith(".mp3"):
@@ -98,8 +98,8 @@ class AudioService:
         stem = Path(input_filename).stem
         output_name = output_filename or f"compressed_{stem}.mp3"
 
-        logger.debug(f"Original file: {input_filename}")
-        logger.debug(f"Output file: {output_name}")
+        logger.debug("Original file: %s", input_filename)
+        logger.debug("Output file: %s", output_name)
 
         async with (
             storage.local_path("audio", input_filename) as input_path,
@@ -112,7 +112,7 @@ class AudioService:
 
         # Get compressed size for logging
         compressed_info = await storage.stat("audio", output_name)
-        logger.info(f"Compressed file size: {compressed_info.size_bytes} bytes")
+        logger.info("Compressed file size: %d bytes", compressed_info.size_bytes)
 
         return AudioProcessingResult(output_file=output_name)
 
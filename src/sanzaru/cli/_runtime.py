@@ -198,12 +198,13 @@ def run_async(command: str) -> Callable[[Callable[P, Coroutine[None, None, int]]
 
                         set_client(None)
                         await client.close()
-                    # The ElevenLabs client is built lazily on first use rather
-                    # than installed here, so this is a no-op (and costs no
-                    # import) for every command that never touched it.
-                    from ..config import close_elevenlabs_client
+                    # The ElevenLabs and URL-fetch clients are built lazily on
+                    # first use rather than installed here, so these are no-ops
+                    # (and cost no import) for every command that never touched them.
+                    from ..config import close_elevenlabs_client, close_http_client
 
                     await close_elevenlabs_client()
+                    await close_http_client()
                     from ..storage import set_storage_backend
 
                     set_storage_backend(None)
@@ -8,13 +8,17 @@ This module handles:
 - Logging setup
 """
 
+import asyncio
 import logging
 import os
 import pathlib
 import sys
+import weakref
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
 from typing import TYPE_CHECKING, Literal
 
+import httpx
 from openai import AsyncOpenAI
 from openai.types import ImageModel
 
@@ -39,8 +43,14 @@ logger = logging.getLogger("sanzaru")
 DEFAULT_IMAGE_MODEL: ImageModel = "gpt-image-2"
 
 
-# ---------- OpenAI client (stateless) ----------
+# ---------- OpenAI client ----------
 _client_override: AsyncOpenAI | None = None
+# One client per (event loop, API key). httpx pools its connections on the loop
+# that opened them, so a client must never be handed to a different loop; the
+# loop is held weakly so a finished loop is neither kept alive nor mistaken for
+# a new one that reuses its id.
+_client_cached: AsyncOpenAI | None = None
+_client_cache_key: "tuple[weakref.ref[asyncio.AbstractEventLoop], str] | None" = None
 
 
 def set_client(client: AsyncOpenAI | None) -> None:
@@ -55,20 +65,132 @@ def set_client(client: AsyncOpenAI | None) -> None:
 
 
 def get_client() -> AsyncOpenAI:
-    """Get an OpenAI async client instance.
+    """Get an OpenAI async client, reusing one connection pool per event loop.
+
+    The MCP server runs every tool call on one loop, so a status poll or a
+    burst of image uploads shares the TLS connections of the calls before it
+    instead of opening a new pool each time. Called outside a running loop,
+    a fresh client is returned, as there is no loop to scope the cache to.
+
+    A cached client for another loop or an earlier key is released before it
+    is replaced (see _retire).
 
     Returns:
-        The installed override (see set_client), or a new client per call
+        The installed override (see set_client), else the cached client for
+        the running loop and current OPENAI_API_KEY
 
     Raises:
         RuntimeError: If OPENAI_API_KEY environment variable is not set
     """
+    global _client_cached, _client_cache_key
     if _client_override is not None:
         return _client_override
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not set")
-    return AsyncOpenAI(api_key=api_key)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AsyncOpenAI(api_key=api_key)
+
+    if _client_cached is not None and _client_cache_key is not None:
+        cached_loop, cached_key = _client_cache_key
+        if cached_loop() is loop and cached_key == api_key:
+            return _client_cached
+        # A rotated key on this loop closes the old pool; one from another
+        # loop is dropped, as its connections cannot be closed from here.
+        _retire(_client_cached.close, cached_loop, loop)
+
+    _client_cached = AsyncOpenAI(api_key=api_key)
+    _client_cache_key = (weakref.ref(loop), api_key)
+    return _client_cached
+
+
+# ---------- Plain HTTP client ----------
+# For URLs fetched outside the OpenAI SDK (Images API results returned as a
+# `url`). Scoped per event loop for the same reason as the OpenAI client.
+_http_client_cached: httpx.AsyncClient | None = None
+_http_client_loop: "weakref.ref[asyncio.AbstractEventLoop] | None" = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get a plain httpx async client, reusing one connection pool per event loop.
+
+    A client cached for an earlier loop is released first (see _retire). The
+    CLI closes the cached client in its teardown via close_http_client().
+
+    Returns:
+        The cached client for the running loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop, where a client
+            could be neither used nor closed
+    """
+    global _http_client_cached, _http_client_loop
+    loop = asyncio.get_running_loop()
+
+    if _http_client_cached is not None and _http_client_loop is not None:
+        if _http_client_loop() is loop:
+            return _http_client_cached
+        _retire(_http_client_cached.aclose, _http_client_loop, loop)
+
+    _http_client_cached = httpx.AsyncClient(timeout=120.0)
+    _http_client_loop = weakref.ref(loop)
+    return _http_client_cached
+
+
+async def close_http_client() -> None:
+    """Close the cached URL-fetch client, if one was created on this loop.
+
+    A no-op for commands that never fetched a URL. Failures are swallowed:
+    like close_elevenlabs_client, this runs in the CLI's teardown `finally`.
+    """
+    global _http_client_cached, _http_client_loop
+    client, owner = _http_client_cached, _http_client_loop
+    _http_client_cached = None
+    _http_client_loop = None
+    if client is None or owner is None or owner() is not asyncio.get_running_loop():
+        return
+    try:
+        await client.aclose()
+    except Exception as exc:  # noqa: BLE001 - teardown must not mask the command's outcome
+        logger.debug("Closing the HTTP client failed: %s", exc)
+
+
+# Close tasks for replaced clients, held so they are not collected mid-flight.
+_retiring: "set[asyncio.Task[None]]" = set()
+
+
+def _retire(
+    close: Callable[[], Awaitable[object]],
+    owner: "weakref.ref[asyncio.AbstractEventLoop]",
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Release a cached client that is about to be replaced.
+
+    The getters are synchronous, so a client owned by the running loop is
+    closed in a background task on that loop. A client owned by another loop
+    is dropped on purpose: its connections are bound to that loop and cannot
+    be closed from this one (and are gone already if the loop has finished).
+
+    Args:
+        close: The client's async close method
+        owner: Weak reference to the loop the client was created on
+        loop: The running loop
+    """
+    if owner() is not loop:
+        return
+
+    async def _close() -> None:
+        try:
+            await close()
+        except Exception as exc:  # noqa: BLE001 - a stale pool must not fail the caller
+            logger.debug("Closing a replaced client failed: %s", exc)
+
+    task = loop.create_task(_close())
+    _retiring.add(task)
+    task.add_done_callback(_retiring.discard)
 
 
 # ---------- ElevenLabs client (optional TTS provider) ----------
@@ -245,10 +245,15 @@ Parameters:
   * Example: ["cat.png"] or ["lotion.jpg", "soap.png", "bomb.jpg"]
   * Use list_reference_images() to discover available images
   * Supported formats: JPEG, PNG, WEBP
+  * Images up to 1 MiB are sent inline; larger ones are uploaded to the OpenAI
+    Files API (purpose "vision") and remain in the account after the job starts
+  * Each call uploads large images anew; to refine, prefer previous_response_id
+    over passing the same images again
 - mask_filename: PNG with alpha channel for inpainting (optional)
   * Defines which region of first input image to edit
   * Transparent = edit this area, black = keep original
   * Requires input_images parameter
+  * Uploaded to the OpenAI Files API and kept in the account like large references
 
 """
     + _IMAGE_MODELS_SUMMARY
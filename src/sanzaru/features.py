@@ -9,6 +9,7 @@ If a path is not configured, the feature is disabled regardless of dependencies.
 
 import logging
 import os
+import sys
 
 logger = logging.getLogger("sanzaru")
 
@@ -63,7 +64,7 @@ def check_audio_available() -> bool:
         logger.info("Audio path configured and dependencies detected - audio tools available")
         return True
     except ImportError as e:
-        logger.warning(f"Audio path set but dependencies not available - audio tools disabled: {e}")
+        logger.warning("Audio path set but dependencies not available - audio tools disabled: %s", e)
         return False
 
 
@@ -87,7 +88,7 @@ def check_image_available() -> bool:
         logger.info("Image path configured and dependencies detected - image tools available")
         return True
     except ImportError as e:
-        logger.warning(f"Image path set but dependencies not available - image tools disabled: {e}")
+        logger.warning("Image path set but dependencies not available - image tools disabled: %s", e)
         return False
 
 
@@ -148,6 +149,26 @@ def check_elevenlabs_available() -> bool:
     return True
 
 
+def check_uvloop_available() -> bool:
+    """Check if the server can run on uvloop.
+
+    uvloop is an optional speedup (the `uvloop` extra), not a feature: without
+    it the server runs on the stdlib asyncio loop. It has no Windows build.
+
+    Returns:
+        True if uvloop is importable on this platform, False otherwise
+    """
+    if sys.platform == "win32":
+        return False
+
+    from importlib.util import find_spec
+
+    try:
+        return find_spec("uvloop") is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def get_available_features() -> dict[str, bool]:
     """Get a dictionary of available media features.
 
@@ -41,10 +41,8 @@ class SecurePathResolver:
         full_path = (self.base_path / safe_filename).resolve()
 
         # Ensure resolved path is still within base_path
-        try:
-            full_path.relative_to(self.base_path)
-        except ValueError:
-            raise ValueError(f"Access denied: path traversal attempt detected in '{filename}'") from None
+        if not full_path.is_relative_to(self.base_path):
+            raise ValueError(f"Access denied: path traversal attempt detected in '{filename}'")
 
         if not full_path.exists():
             raise FileNotFoundError(f"File not found: {safe_filename}")
@@ -70,10 +68,8 @@ class SecurePathResolver:
         full_path = (self.base_path / safe_filename).resolve()
 
         # Ensure resolved path is still within base_path
-        try:
-            full_path.relative_to(self.base_path)
-        except ValueError:
-            raise ValueError(f"Invalid output path: '{name}' resolves outside base directory") from None
+        if not full_path.is_relative_to(self.base_path):
+            raise ValueError(f"Invalid output path: '{name}' resolves outside base directory")
 
         return full_path
 
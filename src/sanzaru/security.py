@@ -42,10 +42,8 @@ def validate_safe_path(base_path: pathlib.Path, filename: str, *, allow_create:
         raise ValueError(f"Invalid filename '{filename}': {e}") from e
 
     # Security: prevent path traversal - ensure resolved path is within base_path
-    try:
-        file_path.relative_to(base_path)
-    except ValueError:
-        raise ValueError(f"Invalid filename: path traversal detected in '{filename}'") from None
+    if not file_path.is_relative_to(base_path):
+        raise ValueError(f"Invalid filename: path traversal detected in '{filename}'")
 
     # Validate existence unless creating new file
     if not allow_create and not file_path.exists():
@@ -12,16 +12,18 @@ import importlib.resources
 import mimetypes
 from typing import Literal
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 from openai.types import VideoModel, VideoSeconds, VideoSize
 from openai.types.responses.tool_param import ImageGeneration
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import FileResponse, Response
 
 from .config import DEFAULT_IMAGE_MODEL, logger
-from .features import check_audio_available, check_image_available, check_video_available
+from .features import check_audio_available, check_image_available, check_uvloop_available, check_video_available
 from .storage.factory import get_storage
+from .storage.local import LocalStorageBackend
 from .tools.media_viewer import MEDIA_TYPE_TO_PATH_TYPE
 
 # Optional dotenv support for local development
@@ -392,16 +394,45 @@ if check_video_available() or check_audio_available() or check_image_available()
         filename: str,
         offset: int = 0,
         chunk_size: int = 2097152,
-    ):
+    ):  # No return annotation: an output schema would send each base64 chunk twice
         return await media_viewer.get_media_data(media_type, filename, offset, chunk_size)
 
     logger.info("Media viewer tools registered (2 tools)")
 
 
+def _parse_byte_range(header: str | None, total_size: int) -> tuple[int, int] | None:
+    """Parse a single ``bytes=start-end`` Range header into (offset, length).
+
+    Returns None for absent, multi-range, or unsatisfiable headers so the
+    caller falls back to a full 200 response.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_s, _, end_s = header[len("bytes=") :].strip().partition("-")
+    try:
+        if start_s:
+            start = int(start_s)
+            end = int(end_s) if end_s else total_size - 1
+        else:  # suffix range: last N bytes
+            start = max(total_size - int(end_s), 0)
+            end = total_size - 1
+    except ValueError:
+        return None
+    end = min(end, total_size - 1)
+    if start > end:
+        return None
+    return start, end - start + 1
+
+
 # Custom HTTP route for direct media serving (functional in HTTP mode)
 @mcp.custom_route("/media/{media_type}/{filename:path}", methods=["GET"])
 async def serve_media(request: Request) -> Response:
-    """Serve media files directly over HTTP — no base64 overhead."""
+    """Serve media files directly over HTTP — no base64 overhead.
+
+    Local files are streamed from disk by ``FileResponse`` (Range requests
+    included), so scrubbing never loads the whole file. Other backends answer
+    single-range requests with ``read_range`` and fall back to a full read.
+    """
     media_type = request.path_params["media_type"]
     filename = request.path_params["filename"]  # Path traversal protection handled by storage backend
 
@@ -409,16 +440,36 @@ async def serve_media(request: Request) -> Response:
     if path_type is None:
         return Response(content="Invalid media type", status_code=400)
 
+    mime, _ = mimetypes.guess_type(filename)
+    content_type = mime or "application/octet-stream"
+
     storage = get_storage()
     try:
+        if isinstance(storage, LocalStorageBackend):
+            async with storage.local_path(path_type, filename) as file_path:
+                if not file_path.is_file():
+                    raise FileNotFoundError(filename)
+                return FileResponse(file_path, media_type=content_type)
+
+        info = await storage.stat(path_type, filename)
+        byte_range = _parse_byte_range(request.headers.get("range"), info.size_bytes)
+        if byte_range is not None:
+            offset, length = byte_range
+            data = await storage.read_range(path_type, filename, offset, length)
+            return Response(
+                content=data,
+                status_code=206,
+                media_type=content_type,
+                headers={
+                    "Accept-Ranges": "bytes",
+                    "Content-Range": f"bytes {offset}-{offset + len(data) - 1}/{info.size_bytes}",
+                },
+            )
         data = await storage.read(path_type, filename)
     except (FileNotFoundError, ValueError):
         return Response(content="Not found", status_code=404)
 
-    mime, _ = mimetypes.guess_type(filename)
-    content_type = mime or "application/octet-stream"
-
-    return Response(content=data, media_type=content_type)
+    return Response(content=data, media_type=content_type, headers={"Accept-Ranges": "bytes"})
 
 
 # ==================== SERVER ENTRYPOINT ====================
@@ -448,21 +499,26 @@ def run_server(transport: Literal["stdio", "http"] = "stdio", host: str = "127.0
         enabled.append("image")
 
     if enabled:
-        logger.info(f"Enabled features: {', '.join(enabled)}")
+        logger.info("Enabled features: %s", ", ".join(enabled))
     else:
         logger.warning("No features enabled - install optional dependencies with: uv add 'sanzaru[all]'")
 
+    # FastMCP.run() always starts the stdlib loop (uvicorn is served inside it,
+    # so its own uvloop detection never applies); start the loop here instead
+    # to pick up uvloop when the extra is installed.
+    backend_options = {"use_uvloop": check_uvloop_available()}
+
     # Run server with selected transport
     if transport == "http":
-        logger.info(f"Starting sanzaru MCP server over HTTP at http://{host}:{port}/mcp")
+        logger.info("Starting sanzaru MCP server over HTTP at http://%s:%s/mcp", host, port)
         # Configure for stateless HTTP (no session IDs needed - all state in OpenAI cloud)
         mcp.settings.stateless_http = True
         mcp.settings.host = host
         mcp.settings.port = port
-        mcp.run(transport="streamable-http")
+        anyio.run(mcp.run_streamable_http_async, backend_options=backend_options)
     else:
         logger.info("Starting sanzaru MCP server over stdio")
-        mcp.run()
+        anyio.run(mcp.run_stdio_async, backend_options=backend_options)
 
 
 def main():
@@ -8,12 +8,15 @@ the default ``STORAGE_BACKEND=local`` setting.
 
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
 import pathlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 import aiofiles
+import anyio
 
 from ..config import get_path
 from ..security import check_not_symlink, validate_safe_path
@@ -22,6 +25,50 @@ from .protocol import FileInfo, PathType
 logger = logging.getLogger("sanzaru")
 
 
+def _pread(path: pathlib.Path, offset: int, length: int) -> bytes:
+    """Read *length* bytes at *offset* — a single ``pread(2)`` where the OS has one."""
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "pread"):
+            return os.pread(f.fileno(), length, offset)
+        f.seek(offset)  # pragma: no cover - Windows has no pread
+        return f.read(length)  # pragma: no cover
+
+
+def _scan(base: pathlib.Path, pattern: str, extensions: set[str] | None) -> list[FileInfo]:
+    """Regular files directly under *base* whose names match *pattern*.
+
+    A single ``scandir`` pass: each entry's type comes from the directory
+    listing itself, so the only per-file syscall is the ``stat`` for size and
+    mtime. Only symlinks need resolving to confirm they stay within *base*.
+    """
+    try:
+        entries = os.scandir(base)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    real_base = base.resolve()
+    results: list[FileInfo] = []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if extensions and os.path.splitext(name)[1].lower() not in extensions:
+                continue
+            if not fnmatch.fnmatch(name, pattern):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            # Security: stay within base
+            target = pathlib.Path(entry.path).resolve() if entry.is_symlink() else real_base / name
+            if not target.is_relative_to(base):
+                logger.debug("Skipping file outside base path: %s", entry.path)
+                continue
+            results.append(FileInfo(name=name, size_bytes=st.st_size, modified_timestamp=st.st_mtime))
+    return results
+
+
 class LocalStorageBackend:
     """Local-disk storage using paths from ``SANZARU_MEDIA_PATH`` (or legacy individual vars).
 
@@ -64,9 +111,9 @@ class LocalStorageBackend:
             raise ValueError(f"offset must be non-negative, got {offset}")
         self._check_symlink(path_type, filename)
         file_path = self._safe(path_type, filename)
-        async with aiofiles.open(file_path, "rb") as f:
-            await f.seek(offset)
-            return await f.read(length)
+        # One worker-thread hop for open+pread+close, where aiofiles would take
+        # one per call — this is the media viewer's per-chunk hot path.
+        return await anyio.to_thread.run_sync(_pread, file_path, offset, length)
 
     async def write(self, path_type: PathType, filename: str, data: bytes) -> str:
         file_path = self._safe(path_type, filename, allow_create=True)
@@ -91,22 +138,9 @@ class LocalStorageBackend:
         pattern: str = "*",
         extensions: set[str] | None = None,
     ) -> list[FileInfo]:
-        base = self._base(path_type)
-        results: list[FileInfo] = []
-        for file_path in base.glob(pattern):
-            if not file_path.is_file():
-                continue
-            if extensions and file_path.suffix.lower() not in extensions:
-                continue
-            # Security: stay within base
-            try:
-                file_path.resolve().relative_to(base)
-            except ValueError:
-                logger.debug("Skipping file outside base path: %s", file_path)
-                continue
-            st = file_path.stat()
-            results.append(FileInfo(name=file_path.name, size_bytes=st.st_size, modified_timestamp=st.st_mtime))
-        return results
+        # Globbing and stat'ing a large directory blocks, so the whole scan
+        # takes a single worker-thread hop instead of running on the loop.
+        return await anyio.to_thread.run_sync(_scan, self._base(path_type), pattern, extensions)
 
     async def stat(self, path_type: PathType, filename: str) -> FileInfo:
         file_path = self._safe(path_type, filename)
@@ -121,8 +155,7 @@ class LocalStorageBackend:
             self._check_symlink(path_type, filename)
             base = self._base(path_type)
             file_path = (base / filename).resolve()
-            file_path.relative_to(base)
-            return file_path.exists()
+            return file_path.is_relative_to(base) and file_path.exists()
         except (ValueError, OSError):
             return False
 
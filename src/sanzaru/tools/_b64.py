@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: MIT
+"""Base64 codec shared by the image and media viewer tools.
+
+Uses ``pybase64`` (SIMD kernels, several times the stdlib's throughput on the
+multi-MB payloads these tools move) when the optional dependency is installed,
+and the stdlib otherwise. Results are identical either way.
+"""
+
+import base64
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    pybase64 = None  # type: ignore[assignment]
+
+# Below this size pybase64's dispatch overhead outweighs the SIMD win.
+_SIMD_MIN_BYTES = 256
+
+
+def b64encode(data: bytes) -> str:
+    """Encode bytes as an ASCII base64 string.
+
+    pybase64 encodes straight into the returned ``str``, so the peak is the
+    input plus one exact-size output; the stdlib path also builds an
+    intermediate ``bytes`` of the same size before decoding it to ``str``.
+    """
+    if pybase64 is not None and len(data) >= _SIMD_MIN_BYTES:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def b64decode(data: str) -> bytes:
+    """Decode a base64 string (non-validating, like ``base64.b64decode``)."""
+    if pybase64 is not None and len(data) >= _SIMD_MIN_BYTES:
+        return pybase64.b64decode(data)
+    return base64.b64decode(data)
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: MIT
+"""Ordered fan-out for per-file work inside a single tool call."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+import anyio
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_in_order(func: Callable[[T], Awaitable[R]], items: Sequence[T]) -> list[R]:
+    """Run ``func`` over ``items`` concurrently and return results in input order.
+
+    Unlike a bare task group, a failure is re-raised as the original exception
+    (the first failing item in input order) rather than wrapped in an
+    ExceptionGroup, so tools keep surfacing the same ValueError/RuntimeError a
+    sequential loop would have. The first failure also cancels the items
+    still running, so a bad input does not wait out (or pay for) its siblings'
+    uploads; the error raised is the first in input order among the items
+    that failed before that cancellation landed.
+
+    Args:
+        func: Async callable applied to each item
+        items: Inputs; results are returned in the same order
+
+    Returns:
+        List of ``func(item)`` results, index-aligned with ``items``
+    """
+    if len(items) == 1:
+        return [await func(items[0])]
+
+    results: list[R | None] = [None] * len(items)
+    errors: list[Exception | None] = [None] * len(items)
+
+    async def _run(index: int) -> None:
+        try:
+            results[index] = await func(items[index])
+        except Exception as e:
+            errors[index] = e
+            tg.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as tg:
+        for index in range(len(items)):
+            tg.start_soon(_run, index)
+
+    for error in errors:
+        if error is not None:
+            raise error
+    return results  # type: ignore[return-value]
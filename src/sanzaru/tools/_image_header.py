@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MIT
+"""Header-only image dimension probe.
+
+The image tools only ever need ``(width, height)`` and the container format of
+bytes they just received from the API, and all three formats OpenAI returns
+(PNG, JPEG, WebP) carry both in their first few hundred bytes. Reading them
+here keeps PIL — ~40 ms to import cold, plus a decoder object per call — off
+the download path entirely. PIL is still imported lazily as the fallback for
+anything these parsers don't recognize.
+"""
+
+import struct
+
+import anyio
+
+# JPEG start-of-frame markers carry the frame dimensions. C4 (DHT), C8 (JPG)
+# and CC (DAC) share the 0xC_ range but are not frames.
+_JPEG_SOF_MARKERS = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+# Markers with no length field after them: TEM, RST0-7, SOI, EOI.
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xDA)})
+
+
+def _png(buf: bytes) -> tuple[int, int] | None:
+    # 8-byte signature, then the IHDR chunk: length(4) type(4) width(4) height(4).
+    if len(buf) < 24 or buf[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", buf[16:24])
+    return width, height
+
+
+def _jpeg(buf: bytes) -> tuple[int, int] | None:
+    pos = 2  # past SOI
+    end = len(buf)
+    while pos + 4 <= end:
+        if buf[pos] != 0xFF:
+            return None
+        marker = buf[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", buf[pos + 2 : pos + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            # length(2) precision(1) height(2) width(2)
+            if pos + 9 > end:
+                return None
+            height, width = struct.unpack(">HH", buf[pos + 5 : pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+
+def _webp(buf: bytes) -> tuple[int, int] | None:
+    chunk = buf[12:16]
+    if chunk == b"VP8 " and len(buf) >= 30:
+        # Lossy: 3-byte frame tag, 3-byte start code, then 14-bit dimensions.
+        if buf[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", buf[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(buf) >= 25:
+        # Lossless: signature byte, then width-1 and height-1 packed in 14 bits each.
+        if buf[20] != 0x2F:
+            return None
+        (bits,) = struct.unpack("<I", buf[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(buf) >= 30:
+        # Extended: flags(4), then 24-bit canvas width-1 and height-1.
+        width = int.from_bytes(buf[24:27], "little") + 1
+        height = int.from_bytes(buf[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _header_dimensions(buf: bytes) -> tuple[tuple[int, int], str] | None:
+    """Dimensions and format read from the header alone, or None if unrecognized."""
+    if buf.startswith(b"\x89PNG\r\n\x1a\n"):
+        size, fmt = _png(buf), "png"
+    elif buf.startswith(b"\xff\xd8"):
+        size, fmt = _jpeg(buf), "jpeg"
+    elif buf[:4] == b"RIFF" and buf[8:12] == b"WEBP":
+        size, fmt = _webp(buf), "webp"
+    else:
+        return None
+    return (size, fmt) if size is not None else None
+
+
+def _pil_dimensions(buf: bytes) -> tuple[tuple[int, int], str]:
+    """Fallback for formats the header parsers don't cover.
+
+    ``Image.open`` is lazy: it reads the header and never allocates pixel
+    data unless ``load()`` is called, which this never does.
+    """
+    import io
+
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(buf))
+    return img.size, img.format.lower() if img.format else "unknown"
+
+
+def parse_dimensions(buf: bytes) -> tuple[tuple[int, int], str]:
+    """Return ``((width, height), format)`` for encoded image bytes.
+
+    PNG, JPEG and WebP are read from their headers without decoding; any other
+    (or malformed) input falls back to PIL, imported only then.
+
+    Args:
+        buf: Encoded image bytes
+
+    Returns:
+        Tuple of (width, height) and the lowercase format name ("png", "jpeg", "webp", ...)
+    """
+    return _header_dimensions(buf) or _pil_dimensions(buf)
+
+
+async def probe_dimensions(buf: bytes) -> tuple[tuple[int, int], str]:
+    """Async :func:`parse_dimensions` for the tools.
+
+    Header parsing is a few byte reads, so it runs inline on the event loop;
+    only the PIL fallback is sent to the thread pool.
+
+    Args:
+        buf: Encoded image bytes
+
+    Returns:
+        Tuple of (width, height) and the lowercase format name
+    """
+    header = _header_dimensions(buf)
+    if header is not None:
+        return header
+    return await anyio.to_thread.run_sync(_pil_dimensions, buf)
@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: MIT
+"""Sorted, limited selection shared by the local file listing tools."""
+
+import heapq
+from collections.abc import Callable, Sequence
+from operator import attrgetter
+from typing import Any, Literal
+
+from ..storage import FileInfo
+
+_SORT_KEYS: dict[str, Callable[[FileInfo], Any]] = {
+    "name": attrgetter("name"),
+    "size": attrgetter("size_bytes"),
+    "modified": attrgetter("modified_timestamp"),
+}
+
+
+def top_files(
+    file_infos: Sequence[FileInfo],
+    sort_by: Literal["name", "size", "modified"],
+    order: Literal["asc", "desc"],
+    limit: int,
+) -> list[FileInfo]:
+    """The first ``limit`` files in the requested order.
+
+    Uses a bounded heap, O(n log limit), rather than sorting the whole
+    directory only to slice off the head. Ties keep their listing order, as
+    with a stable sort.
+    """
+    key = _SORT_KEYS[sort_by]
+    if order == "desc":
+        return heapq.nlargest(limit, file_infos, key=key)
+    return heapq.nsmallest(limit, file_infos, key=key)
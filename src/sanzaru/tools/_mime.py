@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: MIT
+"""Extension and MIME lookups shared by the image and video tools."""
+
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Formats the OpenAI image endpoints accept as inputs.
+IMAGE_MIME_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+        ".webp": "image/webp",
+    }
+)
+
+# Image extension -> the file_type reported by list_reference_images.
+IMAGE_FILE_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        ".jpg": "jpeg",
+        ".jpeg": "jpeg",
+        ".png": "png",
+        ".webp": "webp",
+    }
+)
+
+# Container extension -> the file_type reported by list_local_videos.
+VIDEO_FILE_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        ".mp4": "mp4",
+        ".webm": "webm",
+        ".mov": "mov",
+    }
+)
+
+
+def file_ext(filename: str) -> str:
+    """Lowercase extension including the dot (``"photo.JPG"`` -> ``".jpg"``), or ``""``."""
+    return os.path.splitext(filename)[1].lower()
@@ -7,10 +7,8 @@ This module handles image generation operations:
 - Downloading completed images to reference path
 """
 
-import base64
-import io
-
 import anyio
+from openai import AsyncOpenAI
 from openai._types import Omit, omit
 from openai.types.responses import (
     EasyInputMessageParam,
@@ -21,28 +19,29 @@ from openai.types.responses import (
 )
 from openai.types.responses.response_output_item import ImageGenerationCall
 from openai.types.responses.tool_param import ImageGeneration
-from PIL import Image
 
 from ..config import DEFAULT_IMAGE_MODEL, get_client, logger
 from ..storage import get_storage
 from ..types import ImageDownloadResult, ImageResponse
 from ..utils import generate_filename
+from ._b64 import b64decode, b64encode
+from ._gather import gather_in_order
+from ._image_header import probe_dimensions
+from ._mime import IMAGE_MIME_TYPES, file_ext
+
+# References up to this size travel inline as data URLs and leave nothing in
+# the user's account. Larger ones are uploaded through the Files API so the
+# request body does not carry ~4/3 of every image; those uploads persist.
+# Uploads are not deduplicated across calls: the server keeps no state between
+# tool calls, and a remembered file_id goes stale as soon as the user deletes
+# the file. A refinement via previous_response_id already carries the earlier
+# turn's images, so a reference only needs passing (and uploading) again when
+# the caller chooses to.
+_INLINE_REFERENCE_MAX_BYTES = 1024 * 1024
 
 # ==================== HELPER FUNCTIONS ====================
 
 
-def _encode_image_base64(data: bytes) -> str:
-    """Encode image bytes as base64 string.
-
-    Args:
-        data: Raw image bytes
-
-    Returns:
-        Base64-encoded string (not data URL, just the base64 part)
-    """
-    return base64.b64encode(data).decode("utf-8")
-
-
 def _get_mime_type(filename: str) -> str:
     """Get MIME type from filename extension.
 
@@ -52,21 +51,15 @@ def _get_mime_type(filename: str) -> str:
     Returns:
         MIME type string (e.g., "image/jpeg", "image/png")
     """
-    ext = ("." + filename.rsplit(".", 1)[-1].lower()) if "." in filename else ""
-    mime_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-    }
-    return mime_types.get(ext, "image/jpeg")  # Default to jpeg
+    return IMAGE_MIME_TYPES.get(file_ext(filename), "image/jpeg")  # Default to jpeg
 
 
-async def _upload_mask_file(data: bytes, filename: str) -> str:
-    """Upload mask image to OpenAI Files API.
+async def _upload_image_file(client: AsyncOpenAI, data: bytes, filename: str) -> str:
+    """Upload an image (reference or mask) to OpenAI Files API.
 
     Args:
-        data: Raw mask image bytes (PNG with alpha channel)
+        client: The caller's client, so every upload in a call shares one connection pool
+        data: Raw image bytes
         filename: Original filename for the upload
 
     Returns:
@@ -75,13 +68,28 @@ async def _upload_mask_file(data: bytes, filename: str) -> str:
     Raises:
         ValueError: If upload fails
     """
-    client = get_client()
-
     try:
-        file_obj = await client.files.create(file=(filename, data), purpose="vision")
+        file_obj = await client.files.create(file=(filename, data, _get_mime_type(filename)), purpose="vision")
         return file_obj.id
     except Exception as e:
-        raise ValueError(f"Failed to upload mask file: {e}") from e
+        raise ValueError(f"Failed to upload image file {filename}: {e}") from e
+
+
+async def _delete_uploaded_files(client: AsyncOpenAI, file_ids: list[str]) -> None:
+    """Best-effort removal of uploads a failed create_image call left behind.
+
+    Args:
+        client: The client that uploaded the files
+        file_ids: OpenAI file IDs to delete
+    """
+
+    async def _delete(file_id: str) -> None:
+        try:
+            await client.files.delete(file_id)
+        except Exception as e:
+            logger.warning("Could not delete uploaded file %s: %s", file_id, e)
+
+    await gather_in_order(_delete, file_ids)
 
 
 # ==================== PUBLIC API ====================
@@ -104,8 +112,11 @@ async def create_image(
         tool_config: Optional ImageGeneration tool configuration (size, quality, model, moderation, etc.).
             The image model defaults to gpt-image-2 when "model" is not set here.
         previous_response_id: Optional ID to refine previous generation
-        input_images: Optional list of reference image filenames from IMAGE_PATH
-        mask_filename: Optional PNG mask with alpha channel for inpainting
+        input_images: Optional list of reference image filenames from IMAGE_PATH.
+            Images over 1 MiB are uploaded as ``purpose="vision"`` files, which
+            stay in the OpenAI account once the job has started.
+        mask_filename: Optional PNG mask with alpha channel for inpainting (always
+            uploaded as a ``purpose="vision"`` file)
 
     Returns:
         ImageResponse with response ID, status, and creation timestamp
@@ -152,73 +163,90 @@ async def create_image(
             "gpt-image-2 does not support transparent backgrounds. Use gpt-image-1.5 for transparent output."
         )
 
-    # Handle mask upload if provided
-    if mask_filename:
-        # Validate PNG format from filename
-        mask_ext = ("." + mask_filename.rsplit(".", 1)[-1].lower()) if "." in mask_filename else ""
-        if mask_ext != ".png":
-            raise ValueError("Mask must be PNG format with alpha channel")
-
-        # Read mask via storage backend (handles path validation + security)
-        mask_bytes = await storage.read("reference", mask_filename)
-
-        # Upload to Files API
-        mask_file_id = await _upload_mask_file(mask_bytes, mask_filename)
-        config["input_image_mask"] = {"file_id": mask_file_id}
-
-        logger.info("Uploaded mask %s as file_id %s", mask_filename, mask_file_id)
-
-    # Build input parameter
-    input_param: ResponseInputParam | str
-
-    if input_images:
-        # Structured input with images
-        content_items: ResponseInputMessageContentListParam = [ResponseInputTextParam(type="input_text", text=prompt)]
-
-        for filename in input_images:
-            # Validate file extension
-            ext = ("." + filename.rsplit(".", 1)[-1].lower()) if "." in filename else ""
-            if ext not in {".jpg", ".jpeg", ".png", ".webp"}:
-                raise ValueError(f"Unsupported image format: {filename} (use JPEG, PNG, WEBP)")
-
-            # Read image via storage backend (handles path validation + security)
-            img_bytes = await storage.read("reference", filename)
-
-            # Encode to base64 (in thread pool to avoid blocking event loop)
-            base64_data = await anyio.to_thread.run_sync(_encode_image_base64, img_bytes)
-            mime_type = _get_mime_type(filename)
-
-            # Add to content items
-            image_item: ResponseInputImageParam = {
-                "type": "input_image",
-                "image_url": f"data:{mime_type};base64,{base64_data}",
-                "detail": "auto",
-            }
-            content_items.append(image_item)
-
-        # Build properly typed message
-        message: EasyInputMessageParam = {"role": "user", "content": content_items}
-        input_param = [message]
-
-        logger.info(
-            "Creating image with %d reference image(s)%s",
-            len(input_images),
-            " (config provided)" if tool_config else "",
+    # Files uploaded for this call; deleted again if the job never starts, so a
+    # failed or cancelled upload or request does not strand its siblings in the
+    # account.
+    uploaded: list[str] = []
+    try:
+        # Handle mask upload if provided
+        if mask_filename:
+            # Validate PNG format from filename
+            if file_ext(mask_filename) != ".png":
+                raise ValueError("Mask must be PNG format with alpha channel")
+
+            # Read mask via storage backend (handles path validation + security)
+            mask_bytes = await storage.read("reference", mask_filename)
+
+            # Upload to Files API
+            mask_file_id = await _upload_image_file(client, mask_bytes, mask_filename)
+            uploaded.append(mask_file_id)
+            config["input_image_mask"] = {"file_id": mask_file_id}
+
+            logger.info("Uploaded mask %s as file_id %s", mask_filename, mask_file_id)
+
+        # Build input parameter
+        input_param: ResponseInputParam | str
+
+        if input_images:
+            # Structured input with images
+            content_items: ResponseInputMessageContentListParam = [
+                ResponseInputTextParam(type="input_text", text=prompt)
+            ]
+
+            # Validate every extension before any I/O
+            for filename in input_images:
+                if file_ext(filename) not in IMAGE_MIME_TYPES:
+                    raise ValueError(f"Unsupported image format: {filename} (use JPEG, PNG, WEBP)")
+
+            async def _load_reference(filename: str) -> ResponseInputImageParam:
+                # Read image via storage backend (handles path validation + security)
+                img_bytes = await storage.read("reference", filename)
+
+                if len(img_bytes) <= _INLINE_REFERENCE_MAX_BYTES:
+                    # Encode to base64 (in thread pool to avoid blocking event loop)
+                    base64_data = await anyio.to_thread.run_sync(b64encode, img_bytes)
+                    return {
+                        "type": "input_image",
+                        "image_url": f"data:{_get_mime_type(filename)};base64,{base64_data}",
+                        "detail": "auto",
+                    }
+
+                file_id = await _upload_image_file(client, img_bytes, filename)
+                uploaded.append(file_id)
+                return {"type": "input_image", "file_id": file_id, "detail": "auto"}
+
+            # Reads and uploads overlap across references; order is preserved
+            content_items.extend(await gather_in_order(_load_reference, input_images))
+
+            # Build properly typed message
+            message: EasyInputMessageParam = {"role": "user", "content": content_items}
+            input_param = [message]
+
+            logger.info(
+                "Creating image with %d reference image(s)%s",
+                len(input_images),
+                " (config provided)" if tool_config else "",
+            )
+        else:
+            # Simple text-only input (existing behavior)
+            input_param = prompt
+            logger.info("Creating image from text prompt only")
+
+        # Create response with image generation tool
+        prev_resp_param: str | Omit = omit if previous_response_id is None else previous_response_id
+        response = await client.responses.create(
+            model=model,
+            input=input_param,
+            tools=[config],
+            previous_response_id=prev_resp_param,
+            background=True,
         )
-    else:
-        # Simple text-only input (existing behavior)
-        input_param = prompt
-        logger.info("Creating image from text prompt only")
-
-    # Create response with image generation tool
-    prev_resp_param: str | Omit = omit if previous_response_id is None else previous_response_id
-    response = await client.responses.create(
-        model=model,
-        input=input_param,
-        tools=[config],
-        previous_response_id=prev_resp_param,
-        background=True,
-    )
+    except BaseException:
+        # Cancellation (client disconnect, timeout) must not skip the cleanup,
+        # so it runs shielded from the scope that is being cancelled.
+        with anyio.CancelScope(shield=True):
+            await _delete_uploaded_files(client, uploaded)
+        raise
 
     logger.info(
         "Started image generation %s (%s)%s",
@@ -305,7 +333,7 @@ async def download_image(
 
     # Decode base64 in thread pool (CPU-bound for large images)
     image_base64 = image_gen_call.result
-    image_bytes = await anyio.to_thread.run_sync(base64.b64decode, image_base64)
+    image_bytes = await anyio.to_thread.run_sync(b64decode, image_base64)
 
     # Auto-generate filename if not provided
     if filename is None:
@@ -316,12 +344,8 @@ async def download_image(
     # Write image via storage backend (handles path validation + security)
     await storage.write("reference", filename, image_bytes)
 
-    # Get dimensions in thread pool (PIL operations) - use in-memory bytes
-    def _get_dimensions() -> tuple[tuple[int, int], str]:
-        img = Image.open(io.BytesIO(image_bytes))
-        return img.size, img.format.lower() if img.format else "unknown"
-
-    size, output_format = await anyio.to_thread.run_sync(_get_dimensions)
+    # Read dimensions from the header inline; only unrecognized formats hit PIL (in a thread)
+    size, output_format = await probe_dimensions(image_bytes)
 
     logger.info("Downloaded image %s to %s (%dx%d, %s)", response_id, filename, size[0], size[1], output_format)
 
@@ -10,17 +10,19 @@ rather than the Responses API with tools. Key differences from create_image:
 For non-blocking generation, prefer create_image (Responses API) instead.
 """
 
-import base64
-import io
 from typing import Literal
 
 import anyio
-from PIL import Image
+from openai.types import Image as ImageData
 
-from ..config import DEFAULT_IMAGE_MODEL, get_client, logger
+from ..config import DEFAULT_IMAGE_MODEL, get_client, get_http_client, logger
 from ..storage import get_storage
 from ..types import ImageGenerateResult
 from ..utils import generate_filename
+from ._b64 import b64decode
+from ._gather import gather_in_order
+from ._image_header import probe_dimensions
+from ._mime import IMAGE_MIME_TYPES, file_ext
 
 # Public size alias. Covers the "popular sizes" documented in OpenAI's
 # gpt-image-2 cookbook (April 2026). The API actually accepts any resolution
@@ -47,6 +49,26 @@ ImageBackground = Literal["auto", "transparent", "opaque"]
 ImageOutputFormat = Literal["png", "jpeg", "webp"]
 
 
+async def _image_bytes(image_data: ImageData) -> bytes:
+    """Raw bytes of one Images API result.
+
+    GPT image models always answer with ``b64_json``, decoded here in a thread
+    pool (CPU-bound). Models that answer with a ``url`` instead are fetched as
+    raw bytes over the loop's shared HTTP pool, which skips both the decode
+    pass and base64's 4/3 transfer size.
+
+    Raises:
+        ValueError: If the result carries neither
+    """
+    if image_data.b64_json:
+        return await anyio.to_thread.run_sync(b64decode, image_data.b64_json)
+    if image_data.url:
+        resp = await get_http_client().get(image_data.url)
+        resp.raise_for_status()
+        return resp.content
+    raise ValueError("No base64 image data returned (GPT models always return b64_json)")
+
+
 async def generate_image(
     prompt: str,
     model: str = DEFAULT_IMAGE_MODEL,
@@ -105,12 +127,7 @@ async def generate_image(
     if not response.data or len(response.data) == 0:
         raise ValueError("No image data returned from API")
 
-    image_data = response.data[0]
-    if not image_data.b64_json:
-        raise ValueError("No base64 image data returned (GPT models always return b64_json)")
-
-    # Decode base64 in thread pool (CPU-bound)
-    image_bytes = await anyio.to_thread.run_sync(base64.b64decode, image_data.b64_json)
+    image_bytes = await _image_bytes(response.data[0])
 
     # Generate filename if not provided
     if filename is None:
@@ -119,12 +136,8 @@ async def generate_image(
     # Write image via storage backend
     await storage.write("reference", filename, image_bytes)
 
-    # Get dimensions in thread pool (PIL operations)
-    def _get_dimensions() -> tuple[tuple[int, int], str]:
-        img = Image.open(io.BytesIO(image_bytes))
-        return img.size, img.format.lower() if img.format else "unknown"
-
-    dimensions, detected_format = await anyio.to_thread.run_sync(_get_dimensions)
+    # Read dimensions from the header inline; only unrecognized formats hit PIL (in a thread)
+    dimensions, detected_format = await probe_dimensions(image_bytes)
 
     logger.info(
         "Generated image %s (%dx%d, %s) with %s",
@@ -196,32 +209,24 @@ async def edit_image(
     if len(input_images) > 16:
         raise ValueError("Maximum 16 input images allowed for GPT image models")
 
-    # Mime type mapping
-    mime_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-    }
-
-    # Load and validate input images as tuples (filename, bytes, content_type)
-    image_files: list[tuple[str, bytes, str]] = []
+    # Validate every extension from the filename string before any I/O
     for img_filename in input_images:
-        # Validate extension from filename string
-        ext = "." + img_filename.rsplit(".", 1)[-1].lower() if "." in img_filename else ""
-        if ext not in mime_types:
+        if file_ext(img_filename) not in IMAGE_MIME_TYPES:
             raise ValueError(f"Unsupported image format: {img_filename} (use JPEG, PNG, WEBP)")
 
+    async def _load_input(img_filename: str) -> tuple[str, bytes, str]:
         # Read image file via storage backend (handles path validation + security)
         image_bytes = await storage.read("reference", img_filename)
-        image_files.append((img_filename, image_bytes, mime_types[ext]))
+        return img_filename, image_bytes, IMAGE_MIME_TYPES[file_ext(img_filename)]
+
+    # Load input images concurrently as tuples (filename, bytes, content_type)
+    image_files = await gather_in_order(_load_input, input_images)
 
     # Load mask if provided (as tuple with mime type)
     mask_file: tuple[str, bytes, str] | None = None
     if mask_filename:
         # Validate extension
-        mask_ext = "." + mask_filename.rsplit(".", 1)[-1].lower() if "." in mask_filename else ""
-        if mask_ext != ".png":
+        if file_ext(mask_filename) != ".png":
             raise ValueError("Mask must be PNG format with alpha channel")
 
         mask_bytes = await storage.read("reference", mask_filename)
@@ -265,12 +270,7 @@ async def edit_image(
     if not response.data or len(response.data) == 0:
         raise ValueError("No image data returned from API")
 
-    image_data = response.data[0]
-    if not image_data.b64_json:
-        raise ValueError("No base64 image data returned")
-
-    # Decode base64 in thread pool
-    image_bytes = await anyio.to_thread.run_sync(base64.b64decode, image_data.b64_json)
+    image_bytes = await _image_bytes(response.data[0])
 
     # Generate filename if not provided
     if filename is None:
@@ -279,12 +279,8 @@ async def edit_image(
     # Write image via storage backend
     await storage.write("reference", filename, image_bytes)
 
-    # Get dimensions in thread pool
-    def _get_dimensions() -> tuple[tuple[int, int], str]:
-        img = Image.open(io.BytesIO(image_bytes))
-        return img.size, img.format.lower() if img.format else "unknown"
-
-    dimensions, detected_format = await anyio.to_thread.run_sync(_get_dimensions)
+    # Read dimensions from the header inline; only unrecognized formats hit PIL (in a thread)
+    dimensions, detected_format = await probe_dimensions(image_bytes)
 
     logger.info(
         "Edited image -> %s (%dx%d, %s) with %s",
@@ -6,15 +6,17 @@ Provides two tools:
 - get_media_data: Returns base64-encoded chunks of media data (called by the MCP App)
 """
 
-import base64
 import mimetypes
+from collections import OrderedDict
 from typing import Literal, TypedDict
 
 import anyio
 
 from ..config import logger
 from ..storage.factory import get_storage
-from ..storage.protocol import PathType
+from ..storage.protocol import PathType, StorageBackend
+from ..user_context import get_user_context
+from ._b64 import b64encode
 
 # Media type → storage PathType mapping
 MEDIA_TYPE_TO_PATH_TYPE: dict[str, PathType] = {
@@ -27,6 +29,12 @@ MediaType = Literal["video", "audio", "image"]
 
 DEFAULT_CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 
+# File sizes seen by get_media_data, so the continuation chunks of a playback
+# session skip the stat (a HEAD round-trip on Databricks). Keyed by backend and
+# user context as well as the file, so tenants never share an entry.
+_SIZE_CACHE_MAX = 1024
+_size_cache: OrderedDict[tuple[object, ...], int] = OrderedDict()
+
 
 class ViewMediaResult(TypedDict):
     """Result from view_media tool."""
@@ -70,6 +78,28 @@ def _guess_mime_type(filename: str, media_type: MediaType) -> str:
     return fallbacks.get(media_type, "application/octet-stream")
 
 
+async def _total_size(storage: StorageBackend, path_type: PathType, filename: str, offset: int) -> int:
+    """Size of the file being streamed, stat-ed once per playback session.
+
+    A session starts at offset 0, which always re-stats and refreshes the
+    cache; later chunks reuse that size, so a file rewritten between sessions
+    is picked up on its next first chunk.
+    """
+    key = (storage, get_user_context(), path_type, filename)
+    if offset > 0:
+        cached = _size_cache.get(key)
+        if cached is not None:
+            _size_cache.move_to_end(key)
+            return cached
+
+    info = await storage.stat(path_type, filename)
+    _size_cache[key] = info.size_bytes
+    _size_cache.move_to_end(key)
+    if len(_size_cache) > _SIZE_CACHE_MAX:
+        _size_cache.popitem(last=False)
+    return info.size_bytes
+
+
 async def view_media(media_type: MediaType, filename: str) -> ViewMediaResult:
     """Return metadata for a media file, triggering the MCP App viewer.
 
@@ -114,12 +144,12 @@ async def get_media_data(
 
     .. note::
 
-        This reads the full file via ``storage.read()`` and slices in memory.
-        For the local backend the OS page cache makes repeated reads fast.
-        For remote backends (Databricks), prefer using the HTTP route
-        ``/media/{type}/{name}`` which streams bytes directly without base64
-        overhead.  This tool exists as the universal fallback that works over
-        both stdio and HTTP transports.
+        Only the requested range is read (``storage.read_range()``: a single
+        ``pread`` locally, a ``Range`` request on Databricks), so a playback
+        session moves each byte once rather than re-reading the whole file
+        per chunk. Over HTTP, prefer the ``/media/{type}/{name}`` route, which
+        serves bytes directly without base64 overhead.  This tool exists as
+        the universal fallback that works over both stdio and HTTP transports.
 
     Args:
         media_type: Type of media — "video", "audio", or "image"
@@ -139,9 +169,8 @@ async def get_media_data(
     path_type = _resolve_path_type(media_type)
     storage = get_storage()
 
-    # Get total size via stat (single HEAD request for Databricks)
-    info = await storage.stat(path_type, filename)
-    total_size = info.size_bytes
+    # Get total size via stat (single HEAD request for Databricks), once per session
+    total_size = await _total_size(storage, path_type, filename, offset)
 
     # Read only the requested range (avoids full-file reads on remote backends)
     chunk = await storage.read_range(path_type, filename, offset, chunk_size)
@@ -150,7 +179,7 @@ async def get_media_data(
 
     mime_type = _guess_mime_type(filename, media_type)
     # Base64 encode in thread pool to avoid blocking the event loop
-    encoded = await anyio.to_thread.run_sync(lambda: base64.b64encode(chunk).decode("ascii"))
+    encoded = await anyio.to_thread.run_sync(b64encode, chunk)
 
     logger.debug(
         "get_media_data: %s/%s offset=%d chunk=%d total=%d is_last=%s",
@@ -10,14 +10,19 @@ Generates a multi-voice podcast from a structured script by:
 5. Writing the final audio to the audio storage backend
 
 Speakers choose their provider independently, so a single episode can mix
-OpenAI and ElevenLabs voices — the stitch path is mp3-in, mp3-out.
+OpenAI and ElevenLabs voices — the stitch path takes mp3 (raw PCM from
+OpenAI) and writes mp3.
 """
 
+import logging
+import re
 import time
-from collections.abc import Callable
+import wave
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, replace
 from io import BytesIO
-from typing import Literal, NotRequired, TypedDict
+from typing import Literal, NotRequired, TypedDict, TypeVar
 
 import anyio
 from aioresult import ResultCapture  # type: ignore[import-untyped]
@@ -31,11 +36,13 @@ from ..audio.constants import (
     ELEVENLABS_MODELS,
     ELEVENLABS_SPEED_RANGE,
     MIN_DIALOGUE_SPEAKERS,
+    OPENAI_PCM_SAMPLE_RATE,
     OPENAI_SPEED_RANGE,
     PODCAST_TARGET_FRAME_RATE,
     RENDER_MODES,
     ElevenLabsModel,
     PodcastRenderMode,
+    TTSAudioFormat,
     TTSProviderName,
 )
 from ..audio.providers import (
@@ -49,6 +56,7 @@ from ..audio.providers import (
     synthesize_speech,
     validate_provider_name,
 )
+from ..audio.providers.cache import cache_key
 from ..config import logger
 from ..infrastructure import FileSystemRepository
 
@@ -165,6 +173,30 @@ def _resolve_segment_speech(segment: Segment, speaker: Speaker) -> tuple[float,
     return speed, settings
 
 
+# Required keys per object, in the order a missing-field error lists them.
+_SCRIPT_FIELDS = ("title", "speakers", "segments", "config")
+_CONFIG_FIELDS = ("default_pause_ms", "normalize_loudness", "output_format")
+_SPEAKER_FIELDS = ("id", "name", "voice", "speed", "instructions")
+_SEGMENT_FIELDS = ("speaker", "text")
+_REQUIRED_SETS: dict[tuple[str, ...], frozenset[str]] = {
+    fields: frozenset(fields) for fields in (_SCRIPT_FIELDS, _CONFIG_FIELDS, _SPEAKER_FIELDS, _SEGMENT_FIELDS)
+}
+
+
+def _require_fields(obj: Mapping[str, object], fields: tuple[str, ...], where: str) -> None:
+    """Raise ValueError naming every field of `fields` that `obj` lacks.
+
+    The common all-present case is one C-level keys-view superset test, which
+    matters on the per-segment pass of a long script.
+    """
+    if obj.keys() >= _REQUIRED_SETS[fields]:
+        return
+    missing = [field for field in fields if field not in obj]
+    if len(missing) == 1:
+        raise ValueError(f"{where} missing required field: '{missing[0]}'")
+    raise ValueError(f"{where} missing required fields: {', '.join(repr(f) for f in missing)}")
+
+
 def _validate_script(
     script: PodcastScript,
     default_provider: TTSProviderName = "openai",
@@ -177,9 +209,7 @@ def _validate_script(
 
     Raises ValueError if the script is invalid.
     """
-    for key in ("title", "speakers", "segments", "config"):
-        if key not in script:
-            raise ValueError(f"PodcastScript missing required field: '{key}'")
+    _require_fields(script, _SCRIPT_FIELDS, "PodcastScript")
 
     title = script["title"]
     if not title or not title.strip():
@@ -192,9 +222,7 @@ def _validate_script(
         raise ValueError("PodcastScript supports at most 4 speakers")
 
     config = script["config"]
-    for key in ("default_pause_ms", "normalize_loudness", "output_format"):
-        if key not in config:
-            raise ValueError(f"PodcastConfig missing required field: '{key}'")
+    _require_fields(config, _CONFIG_FIELDS, "PodcastConfig")
 
     if config["output_format"] not in ("mp3", "wav"):
         raise ValueError("PodcastConfig 'output_format' must be 'mp3' or 'wav'")
@@ -223,9 +251,7 @@ def _validate_script(
     speaker_probes: dict[str, tuple[Speaker, TTSProvider, SpeechRequest]] = {}
 
     for i, speaker in enumerate(speakers):
-        for field in ("id", "name", "voice", "speed", "instructions"):
-            if field not in speaker:
-                raise ValueError(f"Speaker {i} missing required field: '{field}'")
+        _require_fields(speaker, _SPEAKER_FIELDS, f"Speaker {i}")
 
         if "provider" in speaker:
             validate_provider_name(speaker["provider"], f"Speaker {i} 'provider'")
@@ -282,10 +308,7 @@ def _validate_script(
         raise ValueError("PodcastScript must have at least 1 segment")
 
     for i, segment in enumerate(segments):
-        if "speaker" not in segment:
-            raise ValueError(f"Segment {i} missing required field: 'speaker'")
-        if "text" not in segment:
-            raise ValueError(f"Segment {i} missing required field: 'text'")
+        _require_fields(segment, _SEGMENT_FIELDS, f"Segment {i}")
         if segment["speaker"] not in speaker_ids:
             raise ValueError(f"Segment {i} references unknown speaker id: '{segment['speaker']}'")
         if not segment["text"].strip():
@@ -347,63 +370,122 @@ def _estimate_duration(
 
 
 def _decode_mp3(raw_bytes: bytes) -> AudioSegment:
-    """Default segment decoder: every TTS provider is asked for mp3."""
+    """Default segment decoder: every TTS provider can be asked for mp3."""
     return AudioSegment.from_mp3(BytesIO(raw_bytes))
 
 
+def _segment_format(provider: TTSProvider) -> TTSAudioFormat:
+    """What to request for a per-segment render on `provider`.
+
+    OpenAI can return raw PCM, which the stitcher wraps without decoding — no
+    ffmpeg process per segment and no lossy mp3 generation before the final
+    encode. ElevenLabs only offers PCM at 44.1kHz on its top tier, so it stays
+    on mp3, as do dialogue renders.
+    """
+    return "pcm" if provider.name == "openai" else "mp3"
+
+
+def _decode_segment(raw_bytes: bytes, audio_format: TTSAudioFormat) -> AudioSegment:
+    """Decode one rendered unit from the format `_segment_format` requested."""
+    if audio_format == "pcm":
+        return AudioSegment(data=raw_bytes, sample_width=2, frame_rate=OPENAI_PCM_SAMPLE_RATE, channels=1)
+    return _decode_mp3(raw_bytes)
+
+
+_SegmentT = TypeVar("_SegmentT")
+
+# 16-bit mono PCM, the layout every segment is converted to before stitching.
+_STITCH_SAMPLE_WIDTH = 2
+
+
+def _silence_bytes(duration_ms: int) -> int:
+    """Byte length of a silence gap in 16-bit mono PCM at the stitch rate (0 if non-positive)."""
+    if duration_ms <= 0:
+        return 0
+    return PODCAST_TARGET_FRAME_RATE * duration_ms // 1000 * _STITCH_SAMPLE_WIDTH
+
+
 def _stitch_audio(
-    segment_bytes_list: list[bytes],
+    segments: Sequence[_SegmentT],
     pause_ms_list: list[int],
     intro_ms: int,
     outro_ms: int,
     normalize_loudness: bool,
     output_format: str,
     output_bitrate: str,
-    decode: Callable[[bytes], AudioSegment] = _decode_mp3,
+    decode: Callable[[_SegmentT], AudioSegment],
 ) -> bytes:
     """Stitch audio segments with silence gaps using pydub.
 
     This is CPU-bound work that runs in a thread pool.
 
     Args:
-        segment_bytes_list: Encoded audio for each segment, in `decode`'s format.
-        pause_ms_list: Silence duration in ms after each segment (same length as segment_bytes_list).
+        segments: One entry per segment, in order; each is handed to `decode`.
+        pause_ms_list: Silence duration in ms after each segment (same length as segments).
         intro_ms: Silence in ms before the first segment.
         outro_ms: Silence in ms after the last segment.
         normalize_loudness: Whether to peak-normalize each segment.
         output_format: Output format ("mp3" or "wav").
         output_bitrate: MP3 bitrate string (e.g., "192k"). Ignored for WAV.
-        decode: Bytes → AudioSegment. Defaults to mp3, which is the TTS contract;
-            simulated podcasts pass a raw-PCM decoder instead, since realtime
-            audio never needs to become mp3 on the way here.
+        decode: Segment entry → AudioSegment. Called once per entry, in order.
+            Simulated podcasts pass raw PCM and a PCM wrapper; generate_podcast
+            passes unit keys and a lookup into the segments it decoded during
+            the TTS fan-out.
 
     Returns:
         Final concatenated audio as bytes.
     """
-    combined = AudioSegment.silent(duration=intro_ms) if intro_ms > 0 else AudioSegment.empty()
-
-    for raw_bytes, pause_ms in zip(segment_bytes_list, pause_ms_list, strict=True):
-        seg = decode(raw_bytes)
+    # Every piece is pinned to one PCM layout, so the episode is assembled from
+    # raw segment bytes plus gap lengths. Chaining ``combined += seg`` copied
+    # the whole episode so far on every segment and every gap.
+    intro_bytes = _silence_bytes(intro_ms)
+    outro_bytes = _silence_bytes(outro_ms)
+    pieces: list[tuple[bytes, int]] = []  # (segment PCM, silence bytes after it)
+
+    for segment, pause_ms in zip(segments, pause_ms_list, strict=True):
+        seg = decode(segment)
         # Sources differ in native rate (OpenAI TTS and realtime 24kHz,
-        # ElevenLabs mp3_44100_128 44.1kHz). pydub would resample on
-        # concatenation anyway, but pinning it here makes a mixed episode
-        # deterministic regardless of segment order.
-        seg = seg.set_frame_rate(PODCAST_TARGET_FRAME_RATE).set_channels(1)
+        # ElevenLabs mp3_44100_128 44.1kHz). Pinning rate, channels and width
+        # here makes a mixed episode deterministic regardless of segment order.
+        seg = seg.set_frame_rate(PODCAST_TARGET_FRAME_RATE).set_channels(1).set_sample_width(_STITCH_SAMPLE_WIDTH)
         if normalize_loudness:
             seg = pydub_normalize(seg)
-        combined += seg
-        if pause_ms > 0:
-            combined += AudioSegment.silent(duration=pause_ms)
-
-    if outro_ms > 0:
-        combined += AudioSegment.silent(duration=outro_ms)
+        pieces.append((seg.raw_data, _silence_bytes(pause_ms)))
 
     output = BytesIO()
-    if output_format == "mp3":
-        combined.export(output, format="mp3", bitrate=output_bitrate)
-    else:
-        combined.export(output, format="wav")
-
+    if output_format == "wav":
+        # WAV is just a header plus the PCM, so it is written piece by piece and
+        # the episode never exists as one buffer. Every gap is a slice of one
+        # shared zero block rather than its own allocation.
+        zeros = memoryview(bytes(max([intro_bytes, outro_bytes, *(gap for _, gap in pieces)])))
+        with wave.open(output, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(_STITCH_SAMPLE_WIDTH)
+            wav.setframerate(PODCAST_TARGET_FRAME_RATE)
+            wav.writeframesraw(zeros[:intro_bytes])
+            for pcm, gap in pieces:
+                wav.writeframesraw(pcm)
+                wav.writeframesraw(zeros[:gap])
+            wav.writeframesraw(zeros[:outro_bytes])
+        return output.getvalue()
+
+    # bytearray() starts zeroed, so every gap is silence already: only segment
+    # PCM is copied in, and the cursor skips over the gaps.
+    episode = bytearray(intro_bytes + sum(len(pcm) + gap for pcm, gap in pieces) + outro_bytes)
+    cursor = intro_bytes
+    for pcm, gap in pieces:
+        episode[cursor : cursor + len(pcm)] = pcm
+        cursor += len(pcm) + gap
+    # Drop the per-segment buffers before ffmpeg runs, so the encode holds
+    # one copy of the episode PCM rather than two.
+    pieces.clear()
+    combined = AudioSegment(
+        data=episode,
+        sample_width=_STITCH_SAMPLE_WIDTH,
+        frame_rate=PODCAST_TARGET_FRAME_RATE,
+        channels=1,
+    )
+    combined.export(output, format="mp3", bitrate=output_bitrate)
     return output.getvalue()
 
 
@@ -429,9 +511,14 @@ def _derive_concurrency_limits(providers: dict[str, TTSProvider], models: dict[s
     return limits
 
 
+# Unicode-aware \w is exactly str.isalnum() plus "_", so accented titles keep
+# their letters; one C-level substitution instead of a per-character genexpr.
+_UNSAFE_TITLE_CHAR = re.compile(r"[^\w-]")
+
+
 def _safe_title(title: str) -> str:
     """Convert a podcast title to a filesystem-safe slug."""
-    return "".join(c if c.isalnum() or c in "-_" else "_" for c in title).strip("_") or "podcast"
+    return _UNSAFE_TITLE_CHAR.sub("_", title).strip("_") or "podcast"
 
 
 @dataclass(frozen=True, slots=True)
@@ -577,8 +664,8 @@ async def generate_podcast(
     # One limiter per provider, built here because CapacityLimiter binds to the
     # running event loop. The same limiter is passed down into synthesize_speech
     # so segment-level and chunk-level parallelism share one budget — which is
-    # what ElevenLabs' concurrency cap actually counts. OpenAI's limit is 0
-    # (unbounded) by default, preserving the historical behavior exactly.
+    # what ElevenLabs' concurrency cap actually counts. OpenAI defaults to 8 in
+    # flight (SANZARU_OPENAI_MAX_CONCURRENCY=0 restores the unbounded fan-out).
     override = config.get("max_concurrency")
     limiters: dict[str, anyio.CapacityLimiter | None] = {}
     for provider_name, derived in _derive_concurrency_limits(providers, models).items():
@@ -608,24 +695,21 @@ async def generate_podcast(
     pause_ms_list = _build_pause_list(units, segments, config.get("default_pause_ms", 600))
     estimated_duration = _estimate_duration(segments, speakers, pause_ms_list, config)
     logger.info(
-        f"Podcast '{title}': {len(segments)} segments, {len(speakers)} speakers, ~{estimated_duration:.0f}s estimated"
+        "Podcast '%s': %d segments, %d speakers, ~%.0fs estimated",
+        title,
+        len(segments),
+        len(speakers),
+        estimated_duration,
     )
 
-    async def _gen_segment(i: int, segment: Segment) -> bytes:
-        """Render one segment. Independent of the others, so #35's verify pass
-        can re-invoke this for just the segments that failed QC."""
+    def _segment_request(segment: Segment) -> SpeechRequest:
         speaker = speaker_map[segment["speaker"]]
         speaker_provider = providers[speaker["id"]]
         speed, voice_settings = _resolve_segment_speech(segment, speaker)
         # `in`-check rather than `or`: an intentional empty-string override must
         # not silently fall back to the speaker's instructions.
         instructions = segment["instruction_override"] if "instruction_override" in segment else speaker["instructions"]
-        # "Queued", not "Generating": the limiter is acquired downstream in
-        # synthesize_speech, so this line fires before the request goes out.
-        logger.info(
-            f"Queued segment {i + 1}/{len(segments)} [{speaker['name']} / {speaker['voice']} / {speaker_provider.name}]"
-        )
-        request = SpeechRequest(
+        return SpeechRequest(
             text=segment["text"],
             voice=speaker_provider.resolve_voice(speaker["voice"]),
             model=models[speaker["id"]],
@@ -634,6 +718,24 @@ async def generate_podcast(
             # per ElevenLabs speaker that carries one.
             instructions=instructions if speaker_provider.name == "openai" else None,
             voice_settings=voice_settings,
+            audio_format=_segment_format(speaker_provider),
+        )
+
+    async def _gen_segment(i: int, segment: Segment) -> bytes:
+        """Render one segment. Independent of the others, so #35's verify pass
+        can re-invoke this for just the segments that failed QC."""
+        speaker = speaker_map[segment["speaker"]]
+        speaker_provider = providers[speaker["id"]]
+        request = _segment_request(segment)
+        # "Queued", not "Generating": the limiter is acquired downstream in
+        # synthesize_speech, so this line fires before the request goes out.
+        logger.info(
+            "Queued segment %d/%d [%s / %s / %s]",
+            i + 1,
+            len(segments),
+            speaker["name"],
+            speaker["voice"],
+            speaker_provider.name,
         )
         return await synthesize_speech(speaker_provider, request, limiter=limiters[speaker_provider.name])
 
@@ -651,11 +753,17 @@ async def generate_podcast(
             )
             for i in unit.indices
         ]
-        names = ", ".join(dict.fromkeys(speaker_map[segments[i]["speaker"]]["name"] for i in unit.indices))
-        logger.info(
-            f"Queued dialogue segments {unit.indices[0] + 1}-{unit.indices[-1] + 1}/{len(segments)} "
-            f"[{names} / {speaker_provider.name}]"
-        )
+        # The speaker-name join exists only for this line, so skip it when INFO is off.
+        if logger.isEnabledFor(logging.INFO):
+            names = ", ".join(dict.fromkeys(speaker_map[segments[i]["speaker"]]["name"] for i in unit.indices))
+            logger.info(
+                "Queued dialogue segments %d-%d/%d [%s / %s]",
+                unit.indices[0] + 1,
+                unit.indices[-1] + 1,
+                len(segments),
+                names,
+                speaker_provider.name,
+            )
         limiter = limiters[speaker_provider.name]
         if limiter is None:
             return await dialogue.synthesize_dialogue(turns, models[unit.speaker_id], config.get("dialogue_stability"))
@@ -668,38 +776,95 @@ async def generate_podcast(
         index = unit.indices[0]
         return await _gen_segment(index, segments[index])
 
-    async with anyio.create_task_group() as tg:
-        captures = [ResultCapture.start_soon(tg, _gen_unit, unit) for unit in units]
-
-    # Read by index, not completion order — the limiter only delays task entry.
-    segment_bytes_list = [c.result() for c in captures]
-
     intro_ms = config.get("intro_silence_ms") or 0
     outro_ms = config.get("outro_silence_ms") or 0
     normalize_loudness = config.get("normalize_loudness", True)
     output_format = config.get("output_format", "mp3")
     output_bitrate = config.get("output_bitrate", "192k")
 
-    logger.info("Stitching podcast audio...")
-    final_audio = await anyio.to_thread.run_sync(
-        lambda: _stitch_audio(
-            segment_bytes_list=segment_bytes_list,
-            pause_ms_list=pause_ms_list,
-            intro_ms=intro_ms,
-            outro_ms=outro_ms,
-            normalize_loudness=normalize_loudness,
-            output_format=output_format,
-            output_bitrate=output_bitrate,
-        )
+    def _unit_format(unit: RenderUnit) -> TTSAudioFormat:
+        return "mp3" if unit.is_dialogue else _segment_format(providers[unit.speaker_id])
+
+    # A lone mp3 unit with no silence to add and no normalization is already
+    # the episode; decoding and re-encoding it would only cost time and a lossy
+    # generation. The provider's own bitrate is kept, not output_bitrate.
+    passthrough = (
+        len(units) == 1
+        and _unit_format(units[0]) == "mp3"
+        and output_format == "mp3"
+        and not normalize_loudness
+        and not intro_ms
+        and not outro_ms
     )
 
+    # A line repeated verbatim in the same voice (a catchphrase, a sponsor
+    # read) is rendered once and reused. The key is the TTS cache's, so it
+    # covers every request field; dialogue units are never shared.
+    unit_keys = [
+        f"dialogue:{unit.indices}"
+        if unit.is_dialogue
+        else cache_key(providers[unit.speaker_id].name, _segment_request(segments[unit.indices[0]]))
+        for unit in units
+    ]
+    unique_units: dict[str, RenderUnit] = {}
+    for unit, key in zip(units, unit_keys, strict=True):
+        unique_units.setdefault(key, unit)
+    if len(unique_units) < len(units):
+        logger.info("%d segment(s) repeat an earlier one verbatim - reusing its audio", len(units) - len(unique_units))
+
+    # Each unit is decoded as soon as it arrives, so ffmpeg runs while later
+    # units are still waiting on the network and the stitch thread only
+    # resamples, normalizes and joins. The encoded bytes are dropped once
+    # decoded; only passthrough keeps them.
+    decoded: dict[str, AudioSegment] = {}
+    remaining_uses = Counter(unit_keys)
+
+    async def _render_unit(key: str, unit: RenderUnit) -> bytes | None:
+        audio = await _gen_unit(unit)
+        if passthrough:
+            return audio
+        decoded[key] = await anyio.to_thread.run_sync(_decode_segment, audio, _unit_format(unit))
+        return None
+
+    def _take_decoded(key: str) -> AudioSegment:
+        # The stitcher converts each segment into its own PCM as it goes, so a
+        # decoded unit is released after its last use rather than held through
+        # the final encode. Repeated lines stay until their last repeat.
+        remaining_uses[key] -= 1
+        return decoded[key] if remaining_uses[key] else decoded.pop(key)
+
+    async with anyio.create_task_group() as tg:
+        captures = {key: ResultCapture.start_soon(tg, _render_unit, key, unit) for key, unit in unique_units.items()}
+
+    if passthrough:
+        logger.info("Single mp3 segment with nothing to stitch - writing it unchanged")
+        rendered = captures[unit_keys[0]].result()
+        assert rendered is not None  # passthrough renders keep their bytes
+        final_audio = rendered
+    else:
+        logger.info("Stitching podcast audio...")
+        # Stitched by index, not completion order — the limiter only delays task entry.
+        final_audio = await anyio.to_thread.run_sync(
+            lambda: _stitch_audio(
+                segments=unit_keys,
+                pause_ms_list=pause_ms_list,
+                intro_ms=intro_ms,
+                outro_ms=outro_ms,
+                normalize_loudness=normalize_loudness,
+                output_format=output_format,
+                output_bitrate=output_bitrate,
+                decode=_take_decoded,
+            )
+        )
+
     timestamp = int(time.time())
     output_filename = f"{_safe_title(title)}_{timestamp}.{output_format}"
     file_repo = FileSystemRepository()
     await file_repo.write_audio_file(output_filename, final_audio)
-    logger.info(f"Podcast written: {output_filename} ({len(final_audio):,} bytes)")
+    logger.info("Podcast written: %s (%d bytes)", output_filename, len(final_audio))
 
-    transcript = "\n\n".join(f"**{speaker_map[s['speaker']]['name']}:** {s['text']}" for s in segments)
+    names = {speaker_id: speaker["name"] for speaker_id, speaker in speaker_map.items()}
+    transcript = "\n\n".join([f"**{names[s['speaker']]}:** {s['text']}" for s in segments])
 
     return PodcastResult(
         output_file=output_filename,
@@ -16,6 +16,16 @@ from PIL import Image
 from ..config import logger
 from ..storage import get_storage
 from ..types import PrepareResult, ReferenceImage
+from ._listing import top_files
+from ._mime import IMAGE_FILE_TYPES, file_ext
+
+# list_reference_images file_type -> extensions passed to storage.list_files.
+_TYPE_EXTENSIONS: dict[str, set[str]] = {
+    "jpeg": {".jpg", ".jpeg"},
+    "png": {".png"},
+    "webp": {".webp"},
+    "all": {".jpg", ".jpeg", ".png", ".webp"},
+}
 
 # ==================== Helper Functions for Image Processing ====================
 
@@ -191,47 +201,24 @@ async def list_reference_images(
     """
     storage = get_storage()
 
-    # Map file_type to extensions
-    type_to_extensions = {
-        "jpeg": {".jpg", ".jpeg"},
-        "png": {".png"},
-        "webp": {".webp"},
-        "all": {".jpg", ".jpeg", ".png", ".webp"},
-    }
-    allowed_extensions = type_to_extensions[file_type]
+    allowed_extensions = _TYPE_EXTENSIONS[file_type]
 
     # Collect matching files via storage backend
     glob_pattern = pattern if pattern else "*"
     file_infos = await storage.list_files("reference", pattern=glob_pattern, extensions=allowed_extensions)
 
-    # Sort files
-    if sort_by == "name":
-        file_infos.sort(key=lambda x: x.name, reverse=(order == "desc"))
-    elif sort_by == "size":
-        file_infos.sort(key=lambda x: x.size_bytes, reverse=(order == "desc"))
-    elif sort_by == "modified":
-        file_infos.sort(key=lambda x: x.modified_timestamp, reverse=(order == "desc"))
-
-    # Build result list
-    results: list[ReferenceImage] = []
-    for info in file_infos[:limit]:
-        # Determine file type from extension
-        ext = ("." + info.name.rsplit(".", 1)[-1].lower()) if "." in info.name else ""
-        if ext in {".jpg", ".jpeg"}:
-            img_type = "jpeg"
-        elif ext == ".png":
-            img_type = "png"
-        else:
-            img_type = "webp"
-
-        results.append(
-            {
-                "filename": info.name,
-                "size_bytes": info.size_bytes,
-                "modified_timestamp": int(info.modified_timestamp),
-                "file_type": img_type,
-            }
-        )
+    # A single-type filter already fixes every file's type; only "all" needs
+    # to read it back off the extension.
+    fixed_type = None if file_type == "all" else file_type
+    results: list[ReferenceImage] = [
+        {
+            "filename": info.name,
+            "size_bytes": info.size_bytes,
+            "modified_timestamp": int(info.modified_timestamp),
+            "file_type": fixed_type or IMAGE_FILE_TYPES.get(file_ext(info.name), "webp"),
+        }
+        for info in top_files(file_infos, sort_by, order, limit)
+    ]
 
     logger.info("Listed %d reference images (pattern=%s, type=%s)", len(results), glob_pattern, file_type)
     return {"data": results}
@@ -1131,7 +1131,7 @@ async def simulate_podcast(
     gaps = [effective.act_gap_ms] * (len(act_pcm) - 1) + [0]
     final_audio = await anyio.to_thread.run_sync(
         lambda: _stitch_audio(
-            segment_bytes_list=act_pcm,
+            segments=act_pcm,
             pause_ms_list=gaps,
             intro_ms=effective.intro_silence_ms,
             outro_ms=effective.outro_silence_ms,
@@ -1144,7 +1144,7 @@ async def simulate_podcast(
 
     output_filename = effective.filename or f"{slug}_{run_id}.{effective.output_format}"
     await repo.write_audio_file(output_filename, final_audio)
-    logger.info("Simulated podcast written: %s (%s bytes)", output_filename, f"{len(final_audio):,}")
+    logger.info("Simulated podcast written: %s (%d bytes)", output_filename, len(final_audio))
 
     stems: dict[str, str] = {}
     if effective.stems:
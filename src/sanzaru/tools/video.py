@@ -9,8 +9,10 @@ This module contains all video-related operations:
 - Remixing existing videos
 """
 
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Literal
 
+import anyio
 from openai._types import Omit, omit
 from openai.types import Video, VideoDeleteResponse, VideoModel, VideoSeconds, VideoSize
 
@@ -18,6 +20,68 @@ from ..config import get_client, logger
 from ..storage import get_storage
 from ..types import DownloadResult, ListResult, VideoFile, VideoSummary
 from ..utils import generate_filename, suffix_for_variant
+from ._listing import top_files
+from ._mime import IMAGE_MIME_TYPES, VIDEO_FILE_TYPES, file_ext
+
+# list_local_videos file_type -> extensions passed to storage.list_files.
+_TYPE_EXTENSIONS: dict[str, set[str]] = {
+    "mp4": {".mp4"},
+    "webm": {".webm"},
+    "mov": {".mov"},
+    "all": {".mp4", ".webm", ".mov"},
+}
+
+# Download reads are buffered up to 8 x 256 KiB ahead of the storage writer.
+_DOWNLOAD_CHUNK_BYTES = 256 * 1024
+_DOWNLOAD_READ_AHEAD = 8
+
+
+async def _write_behind(chunks: AsyncIterator[bytes], write: Callable[[AsyncIterator[bytes]], Awaitable[str]]) -> str:
+    """Feed ``chunks`` to ``write`` through a bounded buffer so reads overlap writes.
+
+    A reader task keeps pulling from the network while the writer is busy
+    with disk or an upload. A read failure reaches the writer mid-stream,
+    exactly as if it had iterated ``chunks`` itself, and whatever ``write``
+    raises is re-raised unwrapped rather than as an ExceptionGroup.
+    """
+    send, receive = anyio.create_memory_object_stream[bytes](_DOWNLOAD_READ_AHEAD)
+    read_error: Exception | None = None
+    write_error: Exception | None = None
+    result = ""
+
+    async def read() -> None:
+        nonlocal read_error
+        async with send:
+            try:
+                async for chunk in chunks:
+                    await send.send(chunk)
+            except anyio.BrokenResourceError:
+                pass  # the writer stopped early; its error is the one to raise
+            except Exception as e:
+                read_error = e
+
+    async def buffered() -> AsyncIterator[bytes]:
+        async for chunk in receive:
+            yield chunk
+        if read_error is not None:
+            raise read_error
+
+    async def write_all() -> None:
+        nonlocal result, write_error
+        try:
+            result = await write(buffered())
+        except Exception as e:
+            write_error = e
+        finally:
+            receive.close()  # unblocks the reader if the writer quit early
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(read)
+        tg.start_soon(write_all)
+
+    if write_error is not None:
+        raise write_error
+    return result
 
 
 async def create_video(
@@ -53,31 +117,27 @@ async def create_video(
         storage = get_storage()
 
         # Validate file extension (Sora supports JPEG, PNG, WEBP)
-        allowed_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-        ext = "." + input_reference_filename.rsplit(".", 1)[-1].lower() if "." in input_reference_filename else ""
-        if ext not in allowed_extensions:
+        ext = file_ext(input_reference_filename)
+        mime_type = IMAGE_MIME_TYPES.get(ext)
+        if mime_type is None:
             raise ValueError(f"Unsupported file type: {ext}. Use: JPEG, PNG, or WEBP")
 
-        # Read reference image via storage backend (handles path validation + security)
-        file_content = await storage.read("reference", input_reference_filename)
-
-        # Determine MIME type from file extension
-        mime_type_map = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".webp": "image/webp",
-        }
-        mime_type = mime_type_map.get(ext, "application/octet-stream")
-
-        # Pass as tuple (filename, bytes, content_type) so SDK can detect MIME type
-        video = await client.videos.create(
-            model=model,
-            prompt=prompt,
-            seconds=seconds_param,
-            size=size_param,
-            input_reference=(input_reference_filename, file_content, mime_type),
-        )
+        # Hand the SDK an open file rather than bytes: httpx streams multipart
+        # file fields in 64 KiB chunks (seeking back to 0 on a retry), so the
+        # image is never held in memory whole. local_path also does the path
+        # validation and symlink checks, downloading first on remote backends.
+        # The open itself, the one call that can stall on a slow mount, runs
+        # in a worker thread.
+        async with storage.local_path("reference", input_reference_filename) as reference_path:
+            reference_file = await anyio.to_thread.run_sync(lambda: reference_path.open("rb"))
+            with reference_file:
+                video = await client.videos.create(
+                    model=model,
+                    prompt=prompt,
+                    seconds=seconds_param,
+                    size=size_param,
+                    input_reference=(input_reference_filename, reference_file, mime_type),
+                )
         logger.info("Started job %s (%s) with reference: %s", video.id, video.status, input_reference_filename)
     else:
         video = await client.videos.create(
@@ -135,9 +195,12 @@ async def download_video(
     if filename is None:
         filename = generate_filename(video_id, suffix)
 
-    # Stream video to storage backend
+    # Stream video to storage backend, reading ahead while each chunk is written
     async with client.with_streaming_response.videos.download_content(video_id, variant=variant) as response:
-        display_path = await storage.write_stream("video", filename, response.iter_bytes())
+        display_path = await _write_behind(
+            response.iter_bytes(_DOWNLOAD_CHUNK_BYTES),
+            lambda chunks: storage.write_stream("video", filename, chunks),
+        )
 
     logger.info("Wrote %s (%s)", display_path, variant)
     return {"filename": filename, "variant": variant}
@@ -161,19 +224,18 @@ async def list_videos(limit: int = 20, after: str | None = None, order: Literal[
     # Convert None to omit for OpenAI SDK (omit = field not sent in API request)
     after_param: str | Omit = omit if after is None else after
     page = await client.videos.list(limit=limit, after=after_param, order=order)
-    items: list[VideoSummary] = []
-    for v in page.data:
-        items.append(
-            {
-                "id": v.id,
-                "status": v.status,
-                "created_at": v.created_at,
-                "seconds": v.seconds,
-                "size": v.size,
-                "model": v.model,
-                "progress": v.progress,
-            }
-        )
+    items: list[VideoSummary] = [
+        {
+            "id": v.id,
+            "status": v.status,
+            "created_at": v.created_at,
+            "seconds": v.seconds,
+            "size": v.size,
+            "model": v.model,
+            "progress": v.progress,
+        }
+        for v in page.data
+    ]
     return {"data": items, "has_more": page.has_more, "last": items[-1]["id"] if items else None}
 
 
@@ -238,47 +300,24 @@ async def list_local_videos(
     """
     storage = get_storage()
 
-    # Map file_type to extensions
-    type_to_extensions: dict[str, set[str]] = {
-        "mp4": {".mp4"},
-        "webm": {".webm"},
-        "mov": {".mov"},
-        "all": {".mp4", ".webm", ".mov"},
-    }
-    allowed_extensions = type_to_extensions[file_type]
+    allowed_extensions = _TYPE_EXTENSIONS[file_type]
 
     # Collect matching files via storage backend
     glob_pattern = pattern if pattern else "*"
     file_infos = await storage.list_files("video", pattern=glob_pattern, extensions=allowed_extensions)
 
-    # Sort files
-    if sort_by == "name":
-        file_infos.sort(key=lambda x: x.name, reverse=(order == "desc"))
-    elif sort_by == "size":
-        file_infos.sort(key=lambda x: x.size_bytes, reverse=(order == "desc"))
-    elif sort_by == "modified":
-        file_infos.sort(key=lambda x: x.modified_timestamp, reverse=(order == "desc"))
-
-    # Build result list
-    results: list[VideoFile] = []
-    for info in file_infos[:limit]:
-        # Determine file type from extension
-        ext = ("." + info.name.rsplit(".", 1)[-1].lower()) if "." in info.name else ""
-        if ext == ".mp4":
-            vid_type = "mp4"
-        elif ext == ".webm":
-            vid_type = "webm"
-        else:
-            vid_type = "mov"
-
-        results.append(
-            {
-                "filename": info.name,
-                "size_bytes": info.size_bytes,
-                "modified_timestamp": int(info.modified_timestamp),
-                "file_type": vid_type,
-            }
-        )
+    # A single-type filter already fixes every file's type; only "all" needs
+    # to read it back off the extension.
+    fixed_type = None if file_type == "all" else file_type
+    results: list[VideoFile] = [
+        {
+            "filename": info.name,
+            "size_bytes": info.size_bytes,
+            "modified_timestamp": int(info.modified_timestamp),
+            "file_type": fixed_type or VIDEO_FILE_TYPES.get(file_ext(info.name), "mov"),
+        }
+        for info in top_files(file_infos, sort_by, order, limit)
+    ]
 
     logger.info("Listed %d local videos (pattern=%s, type=%s)", len(results), glob_pattern, file_type)
     return {"data": results}
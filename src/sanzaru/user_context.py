@@ -23,6 +23,7 @@ Usage::
 from __future__ import annotations
 
 import contextvars
+import functools
 import re
 
 from pydantic import BaseModel, field_validator
@@ -71,14 +72,19 @@ def reset_user_context(token: contextvars.Token[UserContext | None]) -> None:
 # Slug derivation
 # ------------------------------------------------------------------
 
-_SLUG_RE = re.compile(r"[^a-z0-9_]")
+# Runs of anything outside [a-z0-9] (underscores included) become one "_",
+# so a single substitution both replaces and collapses.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
+@functools.lru_cache(maxsize=1024)
 def user_slug(email: str) -> str:
     """Derive a filesystem-safe slug from an email address.
 
     Takes the local part (before ``@``), lowercases it, and replaces
-    any character that is not ``[a-z0-9_]`` with ``_``.
+    each run of characters outside ``[a-z0-9]`` with a single ``_``.
+    Results are memoized: the storage layer derives the slug on every
+    call, and a tenant's email repeats for the life of their session.
 
     Examples::
 
@@ -89,10 +95,7 @@ def user_slug(email: str) -> str:
         >>> user_slug("user@example.com")
         'user'
     """
-    local = email.split("@")[0].lower()
-    slug = _SLUG_RE.sub("_", local)
-    # Collapse consecutive underscores and strip leading/trailing
-    slug = re.sub(r"_+", "_", slug).strip("_")
+    slug = _SLUG_RE.sub("_", email.split("@", 1)[0].lower()).strip("_")
     if not slug:
         raise ValueError(f"Cannot derive user slug from email: {email}")
     return slug
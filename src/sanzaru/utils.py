@@ -4,6 +4,8 @@
 import time
 from typing import Literal
 
+_VARIANT_SUFFIX = {"video": "mp4", "thumbnail": "webp", "spritesheet": "jpg"}
+
 
 def suffix_for_variant(variant: Literal["video", "thumbnail", "spritesheet"]) -> str:
     """Get the file extension for a video asset variant.
@@ -14,7 +16,13 @@ def suffix_for_variant(variant: Literal["video", "thumbnail", "spritesheet"]) ->
     Returns:
         File extension without dot (e.g., "mp4", "webp", "jpg")
     """
-    return {"video": "mp4", "thumbnail": "webp", "spritesheet": "jpg"}[variant]
+    return _VARIANT_SUFFIX[variant]
+
+
+# Last timestamp handed out and how many names have used it, so concurrent
+# generations within one second get distinct names instead of overwriting.
+_last_timestamp = 0
+_same_second_count = 0
 
 
 def generate_filename(base_id: str, suffix: str, *, use_timestamp: bool = False) -> str:
@@ -23,12 +31,19 @@ def generate_filename(base_id: str, suffix: str, *, use_timestamp: bool = False)
     Args:
         base_id: Base identifier for the file (e.g., video_id, "img")
         suffix: File extension without dot (e.g., "mp4", "png")
-        use_timestamp: If True, append current Unix timestamp to base_id
+        use_timestamp: If True, append current Unix timestamp to base_id. Further
+            calls within the same second add a counter ("img_1234567890_1.png").
 
     Returns:
         Generated filename (e.g., "abc123.mp4" or "img_1234567890.png")
     """
+    global _last_timestamp, _same_second_count
+
     if use_timestamp:
         timestamp = int(time.time())
-        return f"{base_id}_{timestamp}.{suffix}"
+        if timestamp != _last_timestamp:
+            _last_timestamp, _same_second_count = timestamp, 0
+            return f"{base_id}_{timestamp}.{suffix}"
+        _same_second_count += 1
+        return f"{base_id}_{timestamp}_{_same_second_count}.{suffix}"
     return f"{base_id}.{suffix}"
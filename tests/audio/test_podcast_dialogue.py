@@ -224,11 +224,19 @@ def podcast_env(mocker, tmp_audio_path):
     from sanzaru.storage.local import LocalStorageBackend
 
     stitch = mocker.patch("sanzaru.tools.podcast._stitch_audio", return_value=b"STITCHED")
+    # Identity decode, so the stitched sequence reads back as rendered bytes.
+    mocker.patch("sanzaru.tools.podcast._decode_segment", side_effect=lambda raw, fmt: raw)
     storage = LocalStorageBackend(path_overrides={"audio": tmp_audio_path})
     mocker.patch("sanzaru.infrastructure.file_system.get_storage", return_value=storage)
     return stitch
 
 
+def stitched(stitch):
+    """Rendered audio the stitcher was handed, in episode order."""
+    kwargs = stitch.call_args.kwargs
+    return [kwargs["decode"](segment) for segment in kwargs["segments"]]
+
+
 class _Endpoint:
     """Records each convert() call and streams back a fixed payload."""
 
@@ -331,7 +339,7 @@ class TestDialogueRendering:
         await generate_podcast(script)
 
         kwargs = podcast_env.call_args.kwargs
-        assert kwargs["segment_bytes_list"] == [b"DIALOGUE"]
+        assert stitched(podcast_env) == [b"DIALOGUE"]
         assert kwargs["pause_ms_list"] == [0]
 
     async def test_estimate_excludes_pauses_the_model_paces(self, mocker, podcast_env):
@@ -415,7 +423,7 @@ class TestDialogueRendering:
         assert openai_client.audio.speech.create.await_count == 2
         # 3 units: openai segment, dialogue run, openai segment — in order.
         kwargs = podcast_env.call_args.kwargs
-        assert kwargs["segment_bytes_list"] == [b"OPENAI", b"DIALOGUE", b"OPENAI"]
+        assert stitched(podcast_env) == [b"OPENAI", b"DIALOGUE", b"OPENAI"]
         # 333 is the trailing pause of the final unit, which never applies.
         assert kwargs["pause_ms_list"] == [100, 222, 0]
 
@@ -430,7 +438,7 @@ class TestDialogueRendering:
 
         script = dialogue_script()
         script["speakers"] = [{"id": "a", "name": "Ann", "voice": "ash", "speed": 1.0, "instructions": ""}]
-        script["segments"] = [{"speaker": "a", "text": "Only OpenAI here."}] * 2
+        script["segments"] = [{"speaker": "a", "text": t} for t in ("Only OpenAI here.", "Still only OpenAI.")]
 
         await generate_podcast(script)
 
@@ -449,7 +457,7 @@ class TestDialogueRendering:
         await generate_podcast(dialogue_script())
 
         assert len(client.dialogue_calls) == 1
-        assert podcast_env.call_args.kwargs["segment_bytes_list"] == [b"DIALOGUE"]
+        assert stitched(podcast_env) == [b"DIALOGUE"]
 
     async def test_segments_mode_never_touches_the_dialogue_endpoint(self, mocker, podcast_env):
         from sanzaru.tools.podcast import generate_podcast
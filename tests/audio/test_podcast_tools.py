@@ -93,6 +93,13 @@ class TestValidateScript:
         with pytest.raises(ValueError, match="missing required field: 'config'"):
             _validate_script(minimal_script)
 
+    def test_every_missing_key_is_reported_at_once(self, minimal_script):
+        """Several missing keys are named together, in declaration order."""
+        del minimal_script["title"]
+        del minimal_script["config"]
+        with pytest.raises(ValueError, match="missing required fields: 'title', 'config'"):
+            _validate_script(minimal_script)
+
     def test_empty_title_raises(self, minimal_script):
         """Empty title string raises ValueError."""
         minimal_script["title"] = "   "
@@ -390,6 +397,7 @@ async def test_generate_podcast_happy_path(mocker, tmp_audio_path):
     # Stub _stitch_audio so pydub/ffmpeg is never invoked
     fake_stitched = b"FAKE_STITCHED_OUTPUT"
     mocker.patch("sanzaru.tools.podcast._stitch_audio", return_value=fake_stitched)
+    mocker.patch("sanzaru.tools.podcast._decode_segment")
 
     # Use local storage backend pointing at tmp dir
     storage = LocalStorageBackend(path_overrides={"audio": tmp_audio_path})
@@ -455,6 +463,7 @@ async def test_generate_podcast_single_speaker_transcript(mocker, tmp_audio_path
     # TTS now routes through the provider layer, which resolves the client there.
     mocker.patch("sanzaru.audio.providers.openai_provider.get_client", return_value=mock_client)
     mocker.patch("sanzaru.tools.podcast._stitch_audio", return_value=b"STITCHED")
+    mocker.patch("sanzaru.tools.podcast._decode_segment")
 
     storage = LocalStorageBackend(path_overrides={"audio": tmp_audio_path})
     mocker.patch("sanzaru.infrastructure.file_system.get_storage", return_value=storage)
@@ -657,6 +666,7 @@ def podcast_env(mocker, tmp_audio_path):
     from sanzaru.storage.local import LocalStorageBackend
 
     mocker.patch("sanzaru.tools.podcast._stitch_audio", return_value=b"STITCHED")
+    mocker.patch("sanzaru.tools.podcast._decode_segment")
     storage = LocalStorageBackend(path_overrides={"audio": tmp_audio_path})
     mocker.patch("sanzaru.infrastructure.file_system.get_storage", return_value=storage)
     return storage
@@ -923,6 +933,7 @@ async def test_segment_order_is_preserved_under_a_limiter(mocker, podcast_env, f
     client.text_to_speech = OrderedTTS()
     mocker.patch("sanzaru.audio.providers.elevenlabs_provider.get_elevenlabs_client", return_value=client)
     stitch = mocker.patch("sanzaru.tools.podcast._stitch_audio", return_value=b"STITCHED")
+    mocker.patch("sanzaru.tools.podcast._decode_segment", side_effect=lambda raw, fmt: raw)
 
     script = {
         "title": "order_ep",
@@ -940,7 +951,103 @@ async def test_segment_order_is_preserved_under_a_limiter(mocker, podcast_env, f
 
     await generate_podcast(script)
 
-    assert stitch.call_args.kwargs["segment_bytes_list"] == [b"aaaa", b"bbb", b"cc", b"d"]
+    kwargs = stitch.call_args.kwargs
+    assert [kwargs["decode"](s) for s in kwargs["segments"]] == [b"aaaa", b"bbb", b"cc", b"d"]
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_generate_podcast_decodes_each_render_as_it_arrives(mocker, podcast_env):
+    """Segments are decoded during the TTS fan-out, and the stitcher looks
+    them up instead of decoding again."""
+    from sanzaru.tools.podcast import _stitch_audio, generate_podcast
+
+    _openai_client(mocker, content=b"SAME_AUDIO")
+    decode = mocker.patch("sanzaru.tools.podcast._decode_segment", return_value="DECODED")
+    script = {
+        "title": "decode_ep",
+        "speakers": [{"id": "h", "name": "A", "voice": "ash", "speed": 1.0, "instructions": ""}],
+        "segments": [{"speaker": "h", "text": t} for t in ("One.", "Two.", "Three.")],
+        "config": {"default_pause_ms": 100, "normalize_loudness": True, "output_format": "mp3"},
+    }
+
+    await generate_podcast(script)
+
+    assert decode.call_count == 3
+    decode.assert_called_with(b"SAME_AUDIO", "pcm")
+    kwargs = _stitch_audio.call_args.kwargs  # type: ignore[attr-defined]
+    assert [kwargs["decode"](s) for s in kwargs["segments"]] == ["DECODED"] * 3
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_repeated_lines_are_rendered_once(mocker, podcast_env):
+    from sanzaru.tools.podcast import _stitch_audio, generate_podcast
+
+    client = _openai_client(mocker)
+    client.audio.speech.create.side_effect = lambda **kw: mocker.MagicMock(content=kw["input"].encode())
+    script = {
+        "title": "bumper_ep",
+        "speakers": [
+            {"id": "h", "name": "A", "voice": "ash", "speed": 1.0, "instructions": ""},
+            {"id": "g", "name": "B", "voice": "nova", "speed": 1.0, "instructions": ""},
+        ],
+        "segments": [
+            {"speaker": "h", "text": "Stay tuned."},
+            {"speaker": "g", "text": "Stay tuned."},  # other voice: its own render
+            {"speaker": "h", "text": "Stay tuned."},
+            {"speaker": "h", "text": "Stay tuned.", "speed_override": 1.2},  # other speed: its own render
+        ],
+        "config": {"default_pause_ms": 100, "normalize_loudness": True, "output_format": "mp3"},
+    }
+
+    await generate_podcast(script)
+
+    assert client.audio.speech.create.await_count == 3
+    kwargs = _stitch_audio.call_args.kwargs  # type: ignore[attr-defined]
+    keys = kwargs["segments"]
+    assert keys[0] == keys[2] and len(set(keys)) == 3
+    # Each decoded render is released after its last use in the episode,
+    # and a shared one survives until its final repeat.
+    for key in keys:
+        kwargs["decode"](key)
+    with pytest.raises(KeyError):
+        kwargs["decode"](keys[2])
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+async def test_lone_mp3_segment_is_written_without_stitching(mocker, podcast_env, fake_elevenlabs, tmp_audio_path):
+    from sanzaru.tools.podcast import _stitch_audio, generate_podcast
+
+    client = fake_elevenlabs.Client(chunks=(b"EL_MP3",))
+    mocker.patch("sanzaru.audio.providers.elevenlabs_provider.get_elevenlabs_client", return_value=client)
+    script = {
+        "title": "solo_ep",
+        "speakers": [
+            {"id": "h", "name": "A", "voice": "v1", "speed": 1.0, "instructions": "", "provider": "elevenlabs"}
+        ],
+        "segments": [{"speaker": "h", "text": "Just one line."}],
+        "config": {"default_pause_ms": 100, "normalize_loudness": False, "output_format": "mp3"},
+    }
+
+    result = await generate_podcast(script)
+
+    _stitch_audio.assert_not_called()  # type: ignore[attr-defined]
+    assert (tmp_audio_path / result.output_file).read_bytes() == b"EL_MP3"
+
+
+@pytest.mark.unit
+def test_openai_segments_are_requested_and_wrapped_as_pcm():
+    from sanzaru.audio.providers import get_provider
+    from sanzaru.tools.podcast import _decode_segment, _segment_format
+
+    assert _segment_format(get_provider("openai")) == "pcm"
+    assert _segment_format(get_provider("elevenlabs")) == "mp3"
+
+    seg = _decode_segment(bytes(24000 * 2), "pcm")  # one second of 24kHz 16-bit mono
+    assert (seg.frame_rate, seg.channels, seg.sample_width) == (24000, 1, 2)
+    assert len(seg) == 1000
 
 
 @pytest.mark.integration
@@ -960,7 +1067,7 @@ def test_stitch_normalizes_mixed_sample_rates(tmp_path):
     from pydub import AudioSegment
     from pydub.generators import Sine
 
-    from sanzaru.tools.podcast import _stitch_audio
+    from sanzaru.tools.podcast import _decode_mp3, _stitch_audio
 
     def mp3_bytes(freq: int, rate: int, ms: int = 500) -> bytes:
         seg = Sine(freq, sample_rate=rate).to_audio_segment(duration=ms).set_channels(1)
@@ -969,13 +1076,14 @@ def test_stitch_normalizes_mixed_sample_rates(tmp_path):
         return buf.getvalue()
 
     out = _stitch_audio(
-        segment_bytes_list=[mp3_bytes(440, 24000), mp3_bytes(660, 44100), mp3_bytes(440, 24000)],
+        segments=[mp3_bytes(440, 24000), mp3_bytes(660, 44100), mp3_bytes(440, 24000)],
         pause_ms_list=[300, 300, 0],
         intro_ms=200,
         outro_ms=200,
         normalize_loudness=True,
         output_format="mp3",
         output_bitrate="192k",
+        decode=_decode_mp3,
     )
 
     final = AudioSegment.from_mp3(io.BytesIO(out))
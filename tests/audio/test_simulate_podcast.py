@@ -201,7 +201,7 @@ class TestStitchWithPcmDecoder:
         from sanzaru.tools.podcast import _stitch_audio
 
         data = _stitch_audio(
-            segment_bytes_list=[_pcm(1.0), _pcm(1.0)],
+            segments=[_pcm(1.0), _pcm(1.0)],
             pause_ms_list=[500, 0],
             intro_ms=0,
             outro_ms=0,
@@ -214,6 +214,54 @@ class TestStitchWithPcmDecoder:
         assert stitched.frame_rate == 44100
         assert len(stitched) == pytest.approx(2500, abs=20)
 
+    def test_intro_gap_and_outro_are_silent_pcm(self):
+        from io import BytesIO
+
+        from pydub import AudioSegment
+
+        from sanzaru.tools.podcast import _stitch_audio
+
+        data = _stitch_audio(
+            segments=[_pcm(0.5)],
+            pause_ms_list=[200],
+            intro_ms=100,
+            outro_ms=300,
+            normalize_loudness=False,
+            output_format="wav",
+            output_bitrate="192k",
+            decode=mixdown.pcm_to_segment,
+        )
+        stitched = AudioSegment.from_file(BytesIO(data), format="wav")
+        assert (stitched.channels, stitched.sample_width) == (1, 2)
+        assert len(stitched) == pytest.approx(1100, abs=5)
+        assert stitched[:100].rms == 0
+        assert stitched[-500:].rms == 0
+        assert stitched[100:600].rms > 0
+
+    def test_mp3_path_copies_segments_into_a_zeroed_buffer(self, mocker):
+        from pydub import AudioSegment
+
+        from sanzaru.tools.podcast import _stitch_audio
+
+        export = mocker.patch.object(AudioSegment, "export", autospec=True)
+        _stitch_audio(
+            segments=[_pcm(0.5), _pcm(0.25)],
+            pause_ms_list=[200, 0],
+            intro_ms=100,
+            outro_ms=300,
+            normalize_loudness=False,
+            output_format="mp3",
+            output_bitrate="192k",
+            decode=mixdown.pcm_to_segment,
+        )
+        episode = export.call_args.args[0]
+        assert len(episode) == pytest.approx(1350, abs=5)
+        assert episode[:100].rms == 0
+        assert episode[100:600].rms > 0
+        assert episode[610:790].rms == 0
+        assert episode[800:1050].rms > 0
+        assert episode[-290:].rms == 0
+
 
 # ---------- pricing ----------
 
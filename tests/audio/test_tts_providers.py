@@ -81,9 +81,12 @@ class TestResolution:
     def test_openai_chunk_limit(self):
         assert get_provider("openai").max_chunk_chars("gpt-4o-mini-tts") == 4000
 
-    def test_openai_is_unbounded_by_default(self):
-        # 0 == unbounded, which is the pre-provider-layer behavior.
-        assert get_provider("openai").max_concurrency("gpt-4o-mini-tts") == 0
+    def test_openai_concurrency_default_and_env_override(self, monkeypatch):
+        provider = get_provider("openai")
+        assert provider.max_concurrency("gpt-4o-mini-tts") == 8
+        # 0 still opts back into the unbounded fan-out.
+        monkeypatch.setenv("SANZARU_OPENAI_MAX_CONCURRENCY", "0")
+        assert provider.max_concurrency("gpt-4o-mini-tts") == 0
 
     def test_elevenlabs_concurrency_default_and_env_override(self, monkeypatch):
         provider = get_provider("elevenlabs")
@@ -190,6 +193,10 @@ class TestElevenLabsValidation:
         with pytest.raises(ValueError, match="between 0.0 and 1.0"):
             get_provider("elevenlabs").validate(elevenlabs_request(voice_settings={key: 1.5}))
 
+    def test_pcm_is_openai_only(self):
+        with pytest.raises(ValueError, match="OpenAI-only"):
+            get_provider("elevenlabs").validate(elevenlabs_request(audio_format="pcm"))
+
     def test_cross_provider_model_rejected(self):
         with pytest.raises(ValueError, match="not an ElevenLabs model"):
             get_provider("elevenlabs").validate(elevenlabs_request(model="gpt-4o-mini-tts"))
@@ -276,6 +283,47 @@ class TestElevenLabsSynthesis:
         assert len(client.text_to_speech.calls) == 1
 
 
+@pytest.mark.unit
+class TestOpenAIRateLimitWindow:
+    @pytest.mark.parametrize(
+        ("header", "seconds"),
+        [("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m3.5s", 3723.5), ("", None), (None, None)],
+    )
+    def test_parse_reset(self, header, seconds):
+        from sanzaru.audio.providers.openai_provider import _parse_reset
+
+        assert _parse_reset(header) == seconds
+
+    async def test_spent_window_holds_the_next_request(self, mocker, monkeypatch):
+        from sanzaru.audio.providers import openai_provider
+
+        monkeypatch.setattr(openai_provider, "_RATE_LIMIT_WINDOW", openai_provider._RateLimitWindow())
+        response = mocker.MagicMock(content=b"MP3")
+        response.response.headers = {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"}
+        client = mocker.MagicMock()
+        client.audio.speech.create = mocker.AsyncMock(return_value=response)
+        mocker.patch.object(openai_provider, "get_client", return_value=client)
+        sleep = mocker.patch.object(openai_provider.anyio, "sleep", mocker.AsyncMock())
+        request = SpeechRequest(text="hi", voice="alloy", model="tts-1")
+
+        await get_provider("openai").synthesize_chunk(request)
+        sleep.assert_not_awaited()
+
+        await get_provider("openai").synthesize_chunk(request)
+        sleep.assert_awaited_once()
+        assert 1.5 < sleep.await_args.args[0] <= 2.0
+
+    async def test_remaining_budget_does_not_wait(self, mocker):
+        from sanzaru.audio.providers.openai_provider import _RateLimitWindow
+
+        sleep = mocker.patch("sanzaru.audio.providers.openai_provider.anyio.sleep", mocker.AsyncMock())
+        window = _RateLimitWindow()
+        window.update({"x-ratelimit-remaining-requests": "3", "x-ratelimit-reset-requests": "2s"})
+
+        await window.wait()
+        sleep.assert_not_awaited()
+
+
 # ---------- chunk orchestration ----------
 
 
@@ -339,6 +387,16 @@ class TestSynthesizeSpeech:
         assert len(parts) > 1
         assert "".join(parts).replace(" ", "") == text.replace(" ", "")
 
+    async def test_multi_chunk_pcm_is_joined_without_decoding(self, mocker):
+        concat = mocker.patch("sanzaru.audio.processor.AudioProcessor.concatenate_audio_segments")
+        provider = StubProvider(chunk_chars=12)
+        text = "Alpha one. Beta two. Gamma three."
+
+        audio = await synthesize_speech(provider, SpeechRequest(text=text, voice="v", model="m", audio_format="pcm"))
+
+        assert audio == "".join(provider.seen).encode()
+        concat.assert_not_called()
+
     async def test_validation_runs_before_any_request(self):
         provider = StubProvider()
         provider.validate = lambda request: (_ for _ in ()).throw(ValueError("nope"))
@@ -347,3 +405,61 @@ class TestSynthesizeSpeech:
             await synthesize_speech(provider, SpeechRequest(text="hi", voice="v", model="m"))
 
         assert provider.seen == []
+
+
+# ---------- on-disk chunk cache ----------
+
+
+@pytest.mark.integration
+@pytest.mark.anyio
+class TestTTSCache:
+    async def test_disabled_by_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SANZARU_TTS_CACHE_DIR", raising=False)
+        provider = StubProvider(chunk_chars=100)
+        request = SpeechRequest(text="same line", voice="v", model="m")
+
+        await synthesize_speech(provider, request)
+        await synthesize_speech(provider, request)
+
+        assert provider.seen == ["same line", "same line"]
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_repeat_request_is_served_from_disk(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SANZARU_TTS_CACHE_DIR", str(tmp_path))
+        provider = StubProvider(chunk_chars=100)
+        request = SpeechRequest(text="welcome back", voice="v", model="m", speed=1.1)
+
+        first = await synthesize_speech(provider, request)
+        second = await synthesize_speech(provider, request)
+
+        assert first == second == b"welcome back"
+        assert provider.seen == ["welcome back"]
+        assert len(list(tmp_path.rglob("*.mp3"))) == 1
+
+    async def test_any_field_change_is_a_miss(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SANZARU_TTS_CACHE_DIR", str(tmp_path))
+        provider = StubProvider(chunk_chars=100)
+        base = SpeechRequest(text="hello", voice="v", model="m")
+
+        await synthesize_speech(provider, base)
+        await synthesize_speech(provider, SpeechRequest(text="hello", voice="w", model="m"))
+        await synthesize_speech(provider, SpeechRequest(text="hello", voice="v", model="m", instructions="warm"))
+
+        assert provider.seen == ["hello", "hello", "hello"]
+
+    async def test_whitespace_differences_share_an_entry(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SANZARU_TTS_CACHE_DIR", str(tmp_path))
+        provider = StubProvider(chunk_chars=100)
+
+        await synthesize_speech(provider, SpeechRequest(text="welcome  back", voice="v", model="m"))
+        await synthesize_speech(provider, SpeechRequest(text=" welcome\nback ", voice="v", model="m"))
+
+        assert provider.seen == ["welcome  back"]
+
+    async def test_unwritable_cache_does_not_fail_the_render(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setenv("SANZARU_TTS_CACHE_DIR", str(blocker))
+        provider = StubProvider(chunk_chars=100)
+
+        assert await synthesize_speech(provider, SpeechRequest(text="hi", voice="v", model="m")) == b"hi"
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 """Integration tests for image input functionality."""
 
+import anyio
 import pytest
 
 from sanzaru.storage.local import LocalStorageBackend
@@ -21,6 +22,7 @@ class TestImageInput:
         mock_response.created_at = 1234567890.0
 
         mock_client.responses.create = mocker.AsyncMock(return_value=mock_response)
+        mock_client.files.create = mocker.AsyncMock(return_value=mocker.MagicMock(id="file_ref123"))
         mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
         storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
         mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
@@ -42,8 +44,18 @@ class TestImageInput:
         assert len(input_param) == 1
         assert input_param[0]["role"] == "user"
 
+        # A small reference travels inline and leaves no file in the account
+        mock_client.files.create.assert_not_awaited()
+        assert input_param[0]["content"][1] == {
+            "type": "input_image",
+            "image_url": "data:image/png;base64,ZmFrZSBwbmcgZGF0YQ==",
+            "detail": "auto",
+        }
+
     async def test_create_image_with_multiple_inputs(self, mocker, tmp_reference_path):
         """Test creating image with multiple reference images."""
+        # Force the upload path for every reference
+        mocker.patch("sanzaru.tools.image._INLINE_REFERENCE_MAX_BYTES", 0)
         mock_client = mocker.MagicMock()
         mock_response = mocker.MagicMock()
         mock_response.id = "resp_multi"
@@ -51,7 +63,10 @@ class TestImageInput:
         mock_response.created_at = 1234567890.0
 
         mock_client.responses.create = mocker.AsyncMock(return_value=mock_response)
-        mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
+        mock_client.files.create = mocker.AsyncMock(
+            side_effect=lambda file, purpose: mocker.MagicMock(id=f"file_{file[0]}")
+        )
+        get_client = mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
         storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
         mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
 
@@ -73,6 +88,84 @@ class TestImageInput:
         assert content[1]["type"] == "input_image"
         assert content[2]["type"] == "input_image"
         assert content[3]["type"] == "input_image"
+        # Uploads run concurrently but content keeps the input order
+        assert [item["file_id"] for item in content[1:]] == ["file_img0.png", "file_img1.png", "file_img2.png"]
+        # All uploads share the call's client rather than building one each
+        get_client.assert_called_once()
+
+    async def test_failed_upload_deletes_sibling_uploads(self, mocker, tmp_reference_path):
+        """A failing reference upload must not strand the ones that succeeded."""
+        mocker.patch("sanzaru.tools.image._INLINE_REFERENCE_MAX_BYTES", 0)
+        mock_client = mocker.MagicMock()
+        mock_client.responses.create = mocker.AsyncMock()
+        created: list[str] = []
+
+        async def upload(file, purpose):
+            if file[0] == "img1.png":
+                raise RuntimeError("quota exceeded")
+            created.append(f"file_{file[0]}")
+            return mocker.MagicMock(id=f"file_{file[0]}")
+
+        mock_client.files.create = mocker.AsyncMock(side_effect=upload)
+        mock_client.files.delete = mocker.AsyncMock()
+        mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
+        storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
+        mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
+        for i in range(3):
+            (tmp_reference_path / f"img{i}.png").write_bytes(b"fake data")
+
+        with pytest.raises(ValueError, match="Failed to upload image file img1.png"):
+            await create_image(prompt="combine", input_images=["img0.png", "img1.png", "img2.png"])
+
+        mock_client.responses.create.assert_not_awaited()
+        # The failure cancels siblings still reading or uploading, so which ones
+        # got as far as the Files API varies; every one that did is deleted.
+        deleted = {call.args[0] for call in mock_client.files.delete.await_args_list}
+        assert deleted == set(created)
+
+    async def test_failed_request_deletes_uploads(self, mocker, tmp_reference_path):
+        """Uploads are removed again when the generation request itself fails."""
+        mocker.patch("sanzaru.tools.image._INLINE_REFERENCE_MAX_BYTES", 0)
+        mock_client = mocker.MagicMock()
+        mock_client.responses.create = mocker.AsyncMock(side_effect=RuntimeError("server error"))
+        mock_client.files.create = mocker.AsyncMock(return_value=mocker.MagicMock(id="file_ref"))
+        mock_client.files.delete = mocker.AsyncMock(side_effect=RuntimeError("already gone"))
+        mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
+        storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
+        mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
+        (tmp_reference_path / "ref.png").write_bytes(b"fake data")
+
+        # The original error surfaces even if cleanup itself fails
+        with pytest.raises(RuntimeError, match="server error"):
+            await create_image(prompt="edit", input_images=["ref.png"])
+
+        mock_client.files.delete.assert_awaited_once_with("file_ref")
+
+    async def test_cancelled_request_deletes_uploads(self, mocker, tmp_reference_path):
+        """Cancelling the call mid-request still removes its uploads."""
+        mocker.patch("sanzaru.tools.image._INLINE_REFERENCE_MAX_BYTES", 0)
+        deleted: list[str] = []
+
+        async def _hang(**_: object) -> None:
+            await anyio.sleep_forever()
+
+        async def _delete(file_id: str) -> None:
+            await anyio.sleep(0)  # would raise if the cleanup were not shielded
+            deleted.append(file_id)
+
+        mock_client = mocker.MagicMock()
+        mock_client.responses.create = mocker.AsyncMock(side_effect=_hang)
+        mock_client.files.create = mocker.AsyncMock(return_value=mocker.MagicMock(id="file_ref"))
+        mock_client.files.delete = mocker.AsyncMock(side_effect=_delete)
+        mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
+        storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
+        mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
+        (tmp_reference_path / "ref.png").write_bytes(b"fake data")
+
+        with anyio.move_on_after(0.05):
+            await create_image(prompt="edit", input_images=["ref.png"])
+
+        assert deleted == ["file_ref"]
 
     async def test_create_image_with_tool_config(self, mocker, tmp_reference_path):
         """Test that custom tool_config is passed through correctly."""
@@ -83,6 +176,7 @@ class TestImageInput:
         mock_response.created_at = 1234567890.0
 
         mock_client.responses.create = mocker.AsyncMock(return_value=mock_response)
+        mock_client.files.create = mocker.AsyncMock(return_value=mocker.MagicMock(id="file_face"))
         mocker.patch("sanzaru.tools.image.get_client", return_value=mock_client)
         storage = LocalStorageBackend(path_overrides={"reference": tmp_reference_path})
         mocker.patch("sanzaru.tools.image.get_storage", return_value=storage)
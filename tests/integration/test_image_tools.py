@@ -2,8 +2,10 @@
 """Integration tests for image generation tools with mocked OpenAI client."""
 
 import base64
+import io
 
 import pytest
+from PIL import Image
 
 from sanzaru.storage.local import LocalStorageBackend
 from sanzaru.tools.image import create_image, download_image, get_image_status
@@ -179,8 +181,10 @@ async def test_image_get_status(mocker):
 @pytest.mark.integration
 async def test_image_download(mocker, tmp_reference_path):
     """Test image download decodes base64 and writes file."""
-    # Create fake base64 data (doesn't need to be valid PNG since we mock Image.open)
-    fake_base64 = base64.b64encode(b"fake png data").decode()
+    # A real PNG: dimensions are read from its IHDR header, no PIL involved
+    png_buffer = io.BytesIO()
+    Image.new("RGB", (1024, 768)).save(png_buffer, "PNG")
+    fake_base64 = base64.b64encode(png_buffer.getvalue()).decode()
 
     # Mock image generation call result
     mock_img_call = mocker.MagicMock()
@@ -197,17 +201,10 @@ async def test_image_download(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.image.get_client")
     mock_get_client.return_value.responses.retrieve = mocker.AsyncMock(return_value=mock_response)
 
-    # Mock PIL Image.open to avoid trying to parse fake PNG
-    # Now called with io.BytesIO(image_bytes) instead of a file path
-    mock_img = mocker.MagicMock()
-    mock_img.size = (1024, 1024)
-    mock_img.format = "PNG"
-    mocker.patch("sanzaru.tools.image.Image.open", return_value=mock_img)
-
     result = await download_image("resp_test123", filename="test.png")
 
     assert result["filename"] == "test.png"
-    assert result["size"] == (1024, 1024)
+    assert result["size"] == (1024, 768)
     assert result["format"] == "png"
 
     # Verify file was written
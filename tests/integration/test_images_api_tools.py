@@ -7,6 +7,7 @@ integration works correctly without making actual API calls.
 
 import base64
 
+import httpx
 import pytest
 from PIL import Image
 
@@ -36,9 +37,8 @@ async def test_generate_image_basic(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    # Mock PIL for dimensions
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    # Mock the header probe for dimensions
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     # Call function
     result = await generate_image(prompt="test image", model="gpt-image-1.5")
@@ -72,8 +72,7 @@ async def test_generate_image_with_custom_filename(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await generate_image(prompt="test", filename="custom_name.png")
 
@@ -96,8 +95,7 @@ async def test_generate_image_all_params(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1536, 1024), format="WEBP")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1536, 1024), "webp"))
 
     result = await generate_image(
         prompt="detailed test image",
@@ -150,8 +148,7 @@ async def test_generate_image_usage_tracking(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await generate_image(prompt="test")
 
@@ -184,6 +181,7 @@ async def test_generate_image_no_b64_error(mocker, tmp_reference_path):
     mock_response = mocker.MagicMock()
     mock_data = mocker.MagicMock()
     mock_data.b64_json = None  # Missing b64_json
+    mock_data.url = None
     mock_response.data = [mock_data]
 
     mocker.patch(
@@ -218,8 +216,7 @@ async def test_generate_image_defaults_to_gpt_image_2(mocker, tmp_reference_path
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await generate_image(prompt="a cat")
 
@@ -244,8 +241,7 @@ async def test_generate_image_gpt_image_2_4k_size(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(3840, 2160), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((3840, 2160), "png"))
 
     await generate_image(prompt="vista", size="3840x2160")
 
@@ -269,6 +265,41 @@ async def test_generate_image_gpt_image_2_rejects_transparent(mocker, tmp_refere
     mock_get_client.return_value.images.generate.assert_not_called()
 
 
+@pytest.mark.integration
+async def test_generate_image_fetches_url_results_as_raw_bytes(mocker, tmp_reference_path):
+    """A url result is downloaded as-is, with no base64 decode pass."""
+    mock_response = mocker.MagicMock()
+    mock_data = mocker.MagicMock()
+    mock_data.b64_json = None
+    mock_data.url = "https://images.example/img.png"
+    mock_response.data = [mock_data]
+    mock_response.usage = None
+
+    mocker.patch(
+        "sanzaru.tools.images_api.get_storage",
+        return_value=LocalStorageBackend(path_overrides={"reference": tmp_reference_path}),
+    )
+    mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
+    mock_get_client.return_value.images.generate = mocker.AsyncMock(return_value=mock_response)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((64, 64), "png"))
+    decode = mocker.patch("sanzaru.tools.images_api.b64decode")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == "https://images.example/img.png"
+        return httpx.Response(200, content=b"raw png bytes")
+
+    mocker.patch(
+        "sanzaru.tools.images_api.get_http_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    result = await generate_image(prompt="test", model="gpt-image-1.5", filename="fetched.png")
+
+    assert (tmp_reference_path / "fetched.png").read_bytes() == b"raw png bytes"
+    assert result.filename == "fetched.png"
+    decode.assert_not_called()
+
+
 # =============================================================================
 # edit_image Tests - Success Paths
 # =============================================================================
@@ -295,8 +326,7 @@ async def test_edit_image_single_input(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await edit_image(prompt="add a hat", input_images=["input.png"])
 
@@ -333,8 +363,7 @@ async def test_edit_image_multiple_inputs(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await edit_image(
         prompt="combine into collage",
@@ -375,8 +404,7 @@ async def test_edit_image_with_mask(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     result = await edit_image(
         prompt="add flamingo in masked area",
@@ -413,8 +441,7 @@ async def test_edit_image_with_input_fidelity(mocker, tmp_reference_path):
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     await edit_image(
         prompt="change hair color",
@@ -456,8 +483,7 @@ async def test_edit_image_mime_types(mocker, tmp_reference_path):
         mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
         mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-        mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-        mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+        mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
         await edit_image(prompt="test", input_images=[filename])
 
@@ -490,8 +516,7 @@ async def test_edit_image_gpt_image_2_drops_input_fidelity(mocker, tmp_reference
     mock_get_client = mocker.patch("sanzaru.tools.images_api.get_client")
     mock_get_client.return_value.images.edit = mocker.AsyncMock(return_value=mock_response)
 
-    mock_img = mocker.MagicMock(size=(1024, 1024), format="PNG")
-    mocker.patch("sanzaru.tools.images_api.Image.open", return_value=mock_img)
+    mocker.patch("sanzaru.tools.images_api.probe_dimensions", return_value=((1024, 1024), "png"))
 
     await edit_image(
         prompt="change hair color",
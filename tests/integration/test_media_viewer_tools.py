@@ -133,3 +133,50 @@ async def test_serve_media_route_invalid_type(mocker):
 
     response = client.get("/media/invalid/file.txt")
     assert response.status_code == 400
+
+
+@pytest.mark.integration
+async def test_serve_media_route_local_range(mocker, tmp_video_path):
+    """Local files honour Range requests without reading the whole file."""
+    from starlette.testclient import TestClient
+
+    content = bytes(range(256)) * 4
+    (tmp_video_path / "scrub.mp4").write_bytes(content)
+
+    storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+    mocker.patch("sanzaru.server.get_storage", return_value=storage)
+    read = mocker.spy(storage, "read")
+
+    from sanzaru.server import mcp
+
+    client = TestClient(mcp.streamable_http_app())
+    response = client.get("/media/video/scrub.mp4", headers={"Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 100-199/1024"
+    assert response.content == content[100:200]
+    read.assert_not_called()
+
+
+@pytest.mark.integration
+async def test_serve_media_route_remote_range(mocker):
+    """Non-local backends serve single ranges through read_range."""
+    from starlette.testclient import TestClient
+
+    from sanzaru.storage.protocol import FileInfo
+
+    storage = mocker.MagicMock()
+    storage.stat = mocker.AsyncMock(return_value=FileInfo(name="clip.mp3", size_bytes=1000, modified_timestamp=0.0))
+    storage.read_range = mocker.AsyncMock(return_value=b"x" * 100)
+    storage.read = mocker.AsyncMock()
+    mocker.patch("sanzaru.server.get_storage", return_value=storage)
+
+    from sanzaru.server import mcp
+
+    client = TestClient(mcp.streamable_http_app())
+    response = client.get("/media/audio/clip.mp3", headers={"Range": "bytes=-100"})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 900-999/1000"
+    storage.read_range.assert_awaited_once_with("audio", "clip.mp3", 900, 100)
+    storage.read.assert_not_called()
@@ -31,6 +31,8 @@ async def test_sora_list_references_with_multiple_files(mocker, tmp_reference_pa
     assert "dog.jpg" in filenames
     assert "bird.webp" in filenames
     assert "readme.txt" not in filenames
+    types = {r["filename"]: r["file_type"] for r in result["data"]}
+    assert types == {"cat.png": "png", "dog.jpg": "jpeg", "bird.webp": "webp"}
 
     # Verify metadata structure
     for img_data in result["data"]:
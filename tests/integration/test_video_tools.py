@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 """Integration tests for video tools with mocked OpenAI client."""
 
+import anyio
 import pytest
 
 from sanzaru.storage.local import LocalStorageBackend
@@ -76,6 +77,89 @@ async def test_sora_download(mocker, tmp_video_path):
     )
 
 
+def _mock_download(mocker, chunks):
+    """Patch get_client so download_content streams the given async iterator."""
+    mock_response = mocker.MagicMock()
+    mock_response.iter_bytes.return_value = chunks
+    mock_stream_ctx = mocker.MagicMock()
+    mock_stream_ctx.__aenter__ = mocker.AsyncMock(return_value=mock_response)
+    mock_stream_ctx.__aexit__ = mocker.AsyncMock(return_value=None)
+    mock_get_client = mocker.patch("sanzaru.tools.video.get_client")
+    mock_get_client.return_value.with_streaming_response.videos.download_content.return_value = mock_stream_ctx
+    return mock_response
+
+
+@pytest.mark.integration
+async def test_download_reads_ahead_of_the_writer(mocker, tmp_video_path):
+    """The writer holds off until every chunk is read; a lockstep copy would deadlock."""
+    all_read = anyio.Event()
+
+    async def network():
+        yield b"a"
+        yield b"b"
+        yield b"c"
+        all_read.set()
+
+    storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+    real_write_stream = storage.write_stream
+
+    async def slow_write_stream(path_type, filename, chunks):
+        await all_read.wait()
+        return await real_write_stream(path_type, filename, chunks)
+
+    mocker.patch.object(storage, "write_stream", side_effect=slow_write_stream)
+    mocker.patch("sanzaru.tools.video.get_storage", return_value=storage)
+    _mock_download(mocker, network())
+
+    with anyio.fail_after(1):
+        await download_video("vid_test123", filename="ahead.mp4")
+
+    assert (tmp_video_path / "ahead.mp4").read_bytes() == b"abc"
+
+
+@pytest.mark.integration
+async def test_download_read_failure_reaches_the_writer_unwrapped(mocker, tmp_video_path):
+    async def network():
+        yield b"partial"
+        raise ConnectionError("reset by peer")
+
+    seen = []
+
+    async def write_stream(path_type, filename, chunks):
+        try:
+            async for chunk in chunks:
+                seen.append(chunk)
+        except ConnectionError:
+            seen.append("error")
+            raise
+        return filename
+
+    mocker.patch("sanzaru.tools.video.get_storage").return_value.write_stream = write_stream
+    _mock_download(mocker, network())
+
+    with pytest.raises(ConnectionError, match="reset by peer"):
+        await download_video("vid_test123", filename="broken.mp4")
+    assert seen == [b"partial", "error"]
+
+
+@pytest.mark.integration
+async def test_download_write_failure_stops_the_reader(mocker):
+    async def endless():
+        while True:
+            yield b"x"
+
+    async def write_stream(path_type, filename, chunks):
+        async for _ in chunks:
+            raise OSError("disk full")
+        return filename
+
+    mocker.patch("sanzaru.tools.video.get_storage").return_value.write_stream = write_stream
+    _mock_download(mocker, endless())
+
+    with anyio.fail_after(1), pytest.raises(OSError, match="disk full"):
+        await download_video("vid_test123", filename="full.mp4")
+
+
 @pytest.mark.integration
 async def test_sora_list(mocker):
     """Test listing videos with pagination."""
@@ -191,14 +275,27 @@ async def test_create_video_with_reference_image_mime_types(mocker, mock_video_q
         call_args = mock_get_client.return_value.videos.create.call_args
         input_reference_arg = call_args.kwargs["input_reference"]
 
-        # Should be a tuple: (filename, bytes, mime_type)
+        # Should be a tuple: (filename, open file, mime_type)
         assert isinstance(input_reference_arg, tuple), f"Expected tuple for {filename}"
         assert len(input_reference_arg) == 3, f"Expected 3-element tuple for {filename}"
         assert input_reference_arg[0] == filename, f"Filename mismatch for {filename}"
-        assert isinstance(input_reference_arg[1], bytes), f"Expected bytes for {filename}"
+        assert input_reference_arg[1].name == str(image_file), f"Expected the open image file for {filename}"
         assert input_reference_arg[2] == expected_mime, f"MIME type mismatch for {filename}: {input_reference_arg[2]}"
 
 
+@pytest.mark.integration
+async def test_create_video_rejects_unsupported_reference_before_reading(mocker):
+    """An unknown extension fails fast, without touching storage or the API."""
+    mock_get_storage = mocker.patch("sanzaru.tools.video.get_storage")
+    mock_get_client = mocker.patch("sanzaru.tools.video.get_client")
+
+    with pytest.raises(ValueError, match=r"Unsupported file type: \.gif"):
+        await create_video(prompt="test video", input_reference_filename="ref.GIF")
+
+    mock_get_storage.return_value.local_path.assert_not_called()
+    mock_get_client.return_value.videos.create.assert_not_called()
+
+
 # ==================== list_local_videos Tests ====================
 
 
@@ -216,8 +313,8 @@ async def test_list_local_videos_basic(mocker, tmp_video_path):
     result = await list_local_videos()
 
     assert len(result["data"]) == 3
-    filenames = {v["filename"] for v in result["data"]}
-    assert filenames == {"video1.mp4", "video2.webm", "video3.mov"}
+    types = {v["filename"]: v["file_type"] for v in result["data"]}
+    assert types == {"video1.mp4": "mp4", "video2.webm": "webm", "video3.mov": "mov"}
     # Verify no path fields leaked
     for item in result["data"]:
         assert "path" not in item
@@ -451,6 +451,115 @@ class TestGetElevenLabsClient:
         assert config.get_elevenlabs_client() is sentinel
 
 
+class _FakeOpenAI:
+    """Records its API key and whether close() was awaited."""
+
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestGetClient:
+    """One pooled AsyncOpenAI per event loop and API key."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, mocker):
+        mocker.patch.object(config, "_client_cached", None)
+        mocker.patch.object(config, "_client_cache_key", None)
+        mocker.patch.object(config, "AsyncOpenAI", side_effect=_FakeOpenAI)
+
+    async def test_reused_within_a_loop(self, mocker):
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k"})
+
+        assert config.get_client() is config.get_client()
+
+    async def test_key_change_builds_a_new_client(self, mocker):
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k1"})
+        first = config.get_client()
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k2"})
+
+        second = config.get_client()
+
+        assert second is not first
+        assert second.api_key == "k2"
+
+    async def test_key_change_closes_the_old_client(self, mocker):
+        import anyio
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k1"})
+        first = config.get_client()
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k2"})
+
+        config.get_client()
+        await anyio.sleep(0)
+
+        assert first.closed
+
+    def test_each_loop_gets_its_own_client(self, mocker):
+        import anyio
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k"})
+
+        async def fetch() -> object:
+            return config.get_client()
+
+        assert anyio.run(fetch) is not anyio.run(fetch)
+
+    def test_outside_a_loop_is_never_cached(self, mocker):
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "k"})
+
+        assert config.get_client() is not config.get_client()
+
+    def test_override_wins(self, mocker):
+        sentinel = SimpleNamespace()
+        mocker.patch.object(config, "_client_override", sentinel)
+
+        assert config.get_client() is sentinel
+
+
+@pytest.mark.unit
+class TestGetHttpClient:
+    """One pooled httpx client per event loop for URL fetches."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, mocker):
+        mocker.patch.object(config, "_http_client_cached", None)
+        mocker.patch.object(config, "_http_client_loop", None)
+
+    async def test_reused_within_a_loop(self):
+        assert config.get_http_client() is config.get_http_client()
+
+    def test_each_loop_gets_its_own_client(self):
+        import anyio
+
+        async def fetch() -> object:
+            return config.get_http_client()
+
+        assert anyio.run(fetch) is not anyio.run(fetch)
+
+    def test_outside_a_loop_raises(self):
+        with pytest.raises(RuntimeError):
+            config.get_http_client()
+
+    async def test_close_releases_the_pool(self):
+        client = config.get_http_client()
+
+        await config.close_http_client()
+
+        assert client.is_closed
+        assert config._http_client_cached is None
+        assert config.get_http_client() is not client
+
+    async def test_close_without_a_client_is_a_noop(self):
+        await config.close_http_client()
+
+        assert config._http_client_cached is None
+
+
 class _FakeHttpxPool:
     """Stands in for the httpx.AsyncClient the SDK's connection pool lives on."""
 
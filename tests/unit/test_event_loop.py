@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: MIT
+"""Unit tests for picking up the optional uvloop event loop at server start."""
+
+import pytest
+
+from sanzaru import server
+from sanzaru.features import check_uvloop_available
+
+
+@pytest.mark.unit
+def test_uvloop_detected_when_installed(mocker):
+    mocker.patch("sanzaru.features.sys.platform", "linux")
+    mocker.patch("importlib.util.find_spec", return_value=object())
+
+    assert check_uvloop_available() is True
+
+
+@pytest.mark.unit
+def test_uvloop_absent_falls_back(mocker):
+    mocker.patch("sanzaru.features.sys.platform", "linux")
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    assert check_uvloop_available() is False
+
+
+@pytest.mark.unit
+def test_uvloop_never_used_on_windows(mocker):
+    mocker.patch("sanzaru.features.sys.platform", "win32")
+    find_spec = mocker.patch("importlib.util.find_spec", return_value=object())
+
+    assert check_uvloop_available() is False
+    find_spec.assert_not_called()
+
+
+@pytest.mark.unit
+def test_broken_install_is_not_fatal(mocker):
+    mocker.patch("sanzaru.features.sys.platform", "linux")
+    mocker.patch("importlib.util.find_spec", side_effect=ValueError("uvloop.__spec__ is None"))
+
+    assert check_uvloop_available() is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("transport", "entrypoint"),
+    [("stdio", "run_stdio_async"), ("http", "run_streamable_http_async")],
+)
+def test_run_server_starts_the_loop_with_uvloop_when_available(mocker, transport, entrypoint):
+    mocker.patch.object(server, "check_uvloop_available", return_value=True)
+    mocker.patch.object(server.mcp.settings, "stateless_http", server.mcp.settings.stateless_http)
+    mocker.patch.object(server.mcp.settings, "host", server.mcp.settings.host)
+    mocker.patch.object(server.mcp.settings, "port", server.mcp.settings.port)
+    run = mocker.patch("sanzaru.server.anyio.run")
+
+    server.run_server(transport=transport)
+
+    run.assert_called_once_with(getattr(server.mcp, entrypoint), backend_options={"use_uvloop": True})
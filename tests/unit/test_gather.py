@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MIT
+"""Unit tests for the ordered fan-out helper used by the image tools."""
+
+import anyio
+import pytest
+
+from sanzaru.tools._gather import gather_in_order
+
+
+@pytest.mark.unit
+async def test_results_follow_input_order():
+    async def slow_first(n: int) -> int:
+        await anyio.sleep(0.01 * (3 - n))
+        return n * 10
+
+    assert await gather_in_order(slow_first, [0, 1, 2]) == [0, 10, 20]
+
+
+@pytest.mark.unit
+async def test_items_run_concurrently():
+    """Each item waits on the other, so a sequential loop would deadlock."""
+    events = {"a": anyio.Event(), "b": anyio.Event()}
+
+    async def handshake(name: str) -> str:
+        events[name].set()
+        await events["b" if name == "a" else "a"].wait()
+        return name
+
+    with anyio.fail_after(1):
+        assert await gather_in_order(handshake, ["a", "b"]) == ["a", "b"]
+
+
+@pytest.mark.unit
+async def test_first_failure_is_raised_unwrapped():
+    async def check(name: str) -> str:
+        if name != "ok.png":
+            raise ValueError(f"missing {name}")
+        return name
+
+    with pytest.raises(ValueError, match="missing first.png"):
+        await gather_in_order(check, ["ok.png", "first.png", "second.png"])
+
+
+@pytest.mark.unit
+async def test_failure_cancels_slow_siblings():
+    finished: list[str] = []
+
+    async def work(name: str) -> str:
+        if name == "bad.png":
+            raise ValueError("missing bad.png")
+        await anyio.sleep(1)
+        finished.append(name)
+        return name
+
+    with anyio.fail_after(0.5), pytest.raises(ValueError, match="missing bad.png"):
+        await gather_in_order(work, ["slow.png", "bad.png"])
+
+    assert finished == []
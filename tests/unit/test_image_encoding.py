@@ -5,36 +5,28 @@ import base64
 
 import pytest
 
-from sanzaru.tools.image import _encode_image_base64, _get_mime_type
+from sanzaru.tools import _b64
+from sanzaru.tools._mime import file_ext
+from sanzaru.tools.image import _get_mime_type
 
 
 @pytest.mark.unit
-class TestEncodeImageBase64:
-    """Test base64 encoding of image bytes."""
+class TestBase64Codec:
+    """The pybase64 fast path and the stdlib fallback must agree byte for byte."""
 
-    def test_encode_success(self):
-        """Test successful base64 encoding of image bytes."""
-        test_data = b"fake png data"
+    @pytest.mark.parametrize("size", [0, 1, 255, 256, 4097])
+    def test_roundtrip_matches_stdlib(self, size):
+        data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+        encoded = _b64.b64encode(data)
+        assert encoded == base64.b64encode(data).decode("ascii")
+        assert _b64.b64decode(encoded) == data
 
-        result = _encode_image_base64(test_data)
-
-        # Verify it's valid base64
-        assert isinstance(result, str)
-        # Verify it decodes to original data
-        decoded = base64.b64decode(result)
-        assert decoded == test_data
-
-    def test_encode_empty_bytes(self):
-        """Test encoding empty bytes returns valid base64."""
-        result = _encode_image_base64(b"")
-        assert isinstance(result, str)
-        assert base64.b64decode(result) == b""
-
-    def test_encode_large_data(self):
-        """Test encoding larger data works correctly."""
-        test_data = b"\x89PNG" + b"\x00" * 10000
-        result = _encode_image_base64(test_data)
-        assert base64.b64decode(result) == test_data
+    def test_stdlib_fallback_without_pybase64(self, monkeypatch):
+        monkeypatch.setattr(_b64, "pybase64", None)
+        data = b"\x89PNG" + b"\x00" * 1000
+        encoded = _b64.b64encode(data)
+        assert encoded == base64.b64encode(data).decode("ascii")
+        assert _b64.b64decode(encoded) == data
 
 
 @pytest.mark.unit
@@ -69,3 +61,8 @@ class TestGetMimeType:
         """Test that unknown extensions default to JPEG."""
         assert _get_mime_type("test.gif") == "image/jpeg"
         assert _get_mime_type("test.bmp") == "image/jpeg"
+
+    def test_dotted_directory_is_not_an_extension(self):
+        """Only the final path component's suffix counts."""
+        assert file_ext("refs.v2/photo") == ""
+        assert file_ext("refs.v2/photo.WEBP") == ".webp"
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT
+"""Unit tests for the header-only image dimension probe."""
+
+import io
+import struct
+
+import anyio
+import pytest
+from PIL import Image, ImageFile, UnidentifiedImageError
+
+from sanzaru.tools._image_header import parse_dimensions, probe_dimensions
+
+
+def _encode(fmt: str, size: tuple[int, int], **save_kwargs) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(10, 20, 30)).save(buffer, fmt, **save_kwargs)
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestParseDimensions:
+    """Header parsing agrees with PIL for every format OpenAI returns."""
+
+    def test_png(self):
+        assert parse_dimensions(_encode("PNG", (1536, 1024))) == ((1536, 1024), "png")
+
+    def test_jpeg_baseline(self):
+        assert parse_dimensions(_encode("JPEG", (640, 480))) == ((640, 480), "jpeg")
+
+    def test_jpeg_progressive(self):
+        """SOF2 is found past the APP/DQT/DHT segments a progressive file carries."""
+        data = _encode("JPEG", (321, 123), progressive=True)
+        assert parse_dimensions(data) == ((321, 123), "jpeg")
+
+    def test_webp_lossy(self):
+        assert parse_dimensions(_encode("WEBP", (800, 600), quality=80)) == ((800, 600), "webp")
+
+    def test_webp_lossless(self):
+        assert parse_dimensions(_encode("WEBP", (333, 222), lossless=True)) == ((333, 222), "webp")
+
+    def test_webp_extended(self):
+        """VP8X stores the canvas size as 24-bit width-1 / height-1."""
+        width, height = 5000, 3
+        payload = b"\x00\x00\x00\x00" + (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little")
+        chunk = b"VP8X" + struct.pack("<I", len(payload)) + payload
+        data = b"RIFF" + struct.pack("<I", 4 + len(chunk)) + b"WEBP" + chunk
+        assert parse_dimensions(data) == ((width, height), "webp")
+
+    def test_header_path_never_imports_pil(self, mocker):
+        """Recognized formats must not touch the PIL fallback."""
+        fallback = mocker.patch("sanzaru.tools._image_header._pil_dimensions")
+        parse_dimensions(_encode("PNG", (8, 8)))
+        fallback.assert_not_called()
+
+    def test_unrecognized_format_falls_back_to_pil(self):
+        assert parse_dimensions(_encode("GIF", (12, 34))) == ((12, 34), "gif")
+
+    def test_truncated_header_falls_back_to_pil(self, mocker):
+        fallback = mocker.patch("sanzaru.tools._image_header._pil_dimensions", return_value=((1, 1), "png"))
+        truncated = _encode("PNG", (8, 8))[:16]
+        assert parse_dimensions(truncated) == ((1, 1), "png")
+        fallback.assert_called_once_with(truncated)
+
+    def test_fallback_never_decodes_pixels(self, mocker):
+        """The PIL fallback reads the header only; pixel data is never loaded."""
+        load_prepare = mocker.spy(ImageFile.ImageFile, "load_prepare")
+        assert parse_dimensions(_encode("BMP", (7, 9))) == ((7, 9), "bmp")
+        load_prepare.assert_not_called()
+
+    def test_fallback_rejects_non_images(self):
+        with pytest.raises(UnidentifiedImageError):
+            parse_dimensions(b"not an image at all")
+
+
+@pytest.mark.unit
+class TestProbeDimensions:
+    """The async probe stays on the event loop unless PIL is needed."""
+
+    async def test_header_formats_skip_the_thread_pool(self, mocker):
+        run_sync = mocker.patch("sanzaru.tools._image_header.anyio.to_thread.run_sync")
+        assert await probe_dimensions(_encode("PNG", (64, 32))) == ((64, 32), "png")
+        run_sync.assert_not_called()
+
+    async def test_pil_fallback_runs_in_a_thread(self, mocker):
+        run_sync = mocker.spy(anyio.to_thread, "run_sync")
+        assert await probe_dimensions(_encode("GIF", (5, 6))) == ((5, 6), "gif")
+        run_sync.assert_called_once()
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: MIT
+"""Unit tests for the sorted, limited selection used by the local listing tools."""
+
+import pytest
+
+from sanzaru.storage import FileInfo
+from sanzaru.tools._listing import top_files
+
+FILES = [
+    FileInfo(name="b.mp4", size_bytes=30, modified_timestamp=2.0),
+    FileInfo(name="a.mp4", size_bytes=10, modified_timestamp=3.0),
+    FileInfo(name="d.mp4", size_bytes=20, modified_timestamp=1.0),
+    FileInfo(name="c.mp4", size_bytes=20, modified_timestamp=4.0),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("sort_by", ["name", "size", "modified"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [0, 2, 4, 10])
+def test_matches_a_stable_sort_then_slice(sort_by, order, limit):
+    attr = {"name": "name", "size": "size_bytes", "modified": "modified_timestamp"}[sort_by]
+    expected = sorted(FILES, key=lambda f: getattr(f, attr), reverse=(order == "desc"))[:limit]
+
+    assert top_files(FILES, sort_by, order, limit) == expected
+
+
+@pytest.mark.unit
+def test_input_is_left_untouched():
+    files = list(FILES)
+
+    top_files(files, "name", "asc", 2)
+
+    assert files == FILES
@@ -218,6 +218,42 @@ async def test_list_files_with_glob_pattern(tmp_path):
     assert names == {"cat_01.png", "cat_02.png"}
 
 
+@pytest.mark.unit
+async def test_list_files_skips_directories_and_dangling_links(tmp_path):
+    ref = tmp_path / "refs"
+    ref.mkdir()
+    (ref / "a.png").write_bytes(b"AAAA")
+    (ref / "folder.png").mkdir()
+    (ref / "gone.png").symlink_to(ref / "missing.png")
+
+    backend = LocalStorageBackend(path_overrides={"reference": ref})
+    files = await backend.list_files("reference", extensions={".png"})
+
+    assert [(f.name, f.size_bytes) for f in files] == [("a.png", 4)]
+
+
+@pytest.mark.unit
+async def test_list_files_follows_links_only_within_base(tmp_path):
+    ref = tmp_path / "refs"
+    ref.mkdir()
+    (ref / "a.png").write_bytes(b"A")
+    (ref / "alias.png").symlink_to(ref / "a.png")
+    outside = tmp_path / "secret.png"
+    outside.write_bytes(b"S")
+    (ref / "escape.png").symlink_to(outside)
+
+    backend = LocalStorageBackend(path_overrides={"reference": ref})
+    files = await backend.list_files("reference")
+
+    assert sorted(f.name for f in files) == ["a.png", "alias.png"]
+
+
+@pytest.mark.unit
+async def test_list_files_missing_directory_is_empty(tmp_path):
+    backend = LocalStorageBackend(path_overrides={"reference": tmp_path / "nope"})
+    assert await backend.list_files("reference") == []
+
+
 # ------------------------------------------------------------------
 # stat
 # ------------------------------------------------------------------
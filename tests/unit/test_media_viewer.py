@@ -199,6 +199,66 @@ class TestGetMediaData:
         assert r3["chunk_size"] == 20
         assert r3["is_last"] is True
 
+    async def test_chunks_never_read_the_whole_file(self, mocker, tmp_video_path):
+        """Each chunk reads only its own range, so a session moves every byte once."""
+        (tmp_video_path / "ranged.mp4").write_bytes(bytes(range(100)))
+
+        storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+        mocker.patch("sanzaru.tools.media_viewer.get_storage", return_value=storage)
+        full_read = mocker.spy(storage, "read")
+
+        result = await get_media_data("video", "ranged.mp4", offset=90, chunk_size=40)
+
+        assert base64.b64decode(result["data"]) == bytes(range(90, 100))
+        full_read.assert_not_called()
+
+    async def test_continuation_chunks_reuse_the_sessions_stat(self, mocker, tmp_video_path):
+        """Only the first chunk of a session stats the file."""
+        (tmp_video_path / "session.mp4").write_bytes(b"A" * 100)
+
+        storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+        mocker.patch("sanzaru.tools.media_viewer.get_storage", return_value=storage)
+        stat = mocker.spy(storage, "stat")
+
+        for offset in (0, 40, 80):
+            result = await get_media_data("video", "session.mp4", offset=offset, chunk_size=40)
+            assert result["total_size"] == 100
+
+        assert stat.call_count == 1
+
+    async def test_a_new_session_sees_a_rewritten_file(self, mocker, tmp_video_path):
+        """Offset 0 always re-stats, so a file rewritten between sessions is not stale."""
+        test_file = tmp_video_path / "rewritten.mp4"
+        test_file.write_bytes(b"A" * 100)
+
+        storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+        mocker.patch("sanzaru.tools.media_viewer.get_storage", return_value=storage)
+
+        await get_media_data("video", "rewritten.mp4", offset=0, chunk_size=40)
+        test_file.write_bytes(b"B" * 300)
+        result = await get_media_data("video", "rewritten.mp4", offset=0, chunk_size=40)
+
+        assert result["total_size"] == 300
+        assert result["is_last"] is False
+
+    async def test_users_do_not_share_cached_sizes(self, mocker, tmp_video_path):
+        """The cache key includes the user context (per-user Databricks prefixes)."""
+        from sanzaru.user_context import UserContext, reset_user_context, set_user_context
+
+        (tmp_video_path / "shared.mp4").write_bytes(b"A" * 100)
+        storage = LocalStorageBackend(path_overrides={"video": tmp_video_path})
+        mocker.patch("sanzaru.tools.media_viewer.get_storage", return_value=storage)
+        stat = mocker.spy(storage, "stat")
+
+        for email in ("a@example.com", "b@example.com"):
+            token = set_user_context(UserContext(email=email))
+            try:
+                await get_media_data("video", "shared.mp4", offset=40, chunk_size=40)
+            finally:
+                reset_user_context(token)
+
+        assert stat.call_count == 2
+
     async def test_offset_past_end(self, mocker, tmp_video_path):
         """Offset past file end returns empty chunk with is_last=True."""
         test_file = tmp_video_path / "short.mp4"
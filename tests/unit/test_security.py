@@ -40,6 +40,13 @@ class TestValidateSafePath:
         with pytest.raises(ValueError, match="path traversal detected"):
             validate_safe_path(tmp_reference_path, "/etc/passwd")
 
+    def test_sibling_with_shared_prefix_rejected(self, tmp_reference_path):
+        """Test that a sibling directory sharing the base's name prefix is outside it."""
+        sibling = tmp_reference_path.parent / (tmp_reference_path.name + "2")
+        sibling.mkdir()
+        with pytest.raises(ValueError, match="path traversal detected"):
+            validate_safe_path(tmp_reference_path, f"../{sibling.name}/x.png")
+
     def test_file_not_found_when_allow_create_false(self, tmp_reference_path):
         """Test that non-existent files raise error when allow_create=False."""
         with pytest.raises(ValueError, match="File not found: nonexistent.png"):
@@ -57,6 +57,15 @@ class TestUserSlug:
     def test_underscores_preserved(self):
         assert user_slug("user_name@example.com") == "user_name"
 
+    def test_mixed_run_with_underscores_collapsed(self):
+        assert user_slug("a_.-_b@example.com") == "a_b"
+
+    def test_invalid_email_raises_on_every_call(self):
+        """The memo cache must not swallow the error on a repeat lookup."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Cannot derive user slug"):
+                user_slug("--@example.com")
+
 
 # ------------------------------------------------------------------
 # ContextVar get/set/reset
@@ -45,3 +45,15 @@ class TestGenerateFilename:
         result = generate_filename("test", "jpg", use_timestamp=True)
         assert result == "test_9999999999.jpg"
         assert "." not in result.split("_")[1].split(".")[0]  # No decimal in timestamp part
+
+    @patch("sanzaru.utils.time.time", return_value=1111111111.0)
+    def test_same_second_names_do_not_collide(self, mock_time):
+        first = generate_filename("gen", "png", use_timestamp=True)
+        second = generate_filename("gen", "png", use_timestamp=True)
+        third = generate_filename("edit", "png", use_timestamp=True)
+        assert first == "gen_1111111111.png"
+        assert second == "gen_1111111111_1.png"
+        assert third == "edit_1111111111_2.png"
+
+        mock_time.return_value = 1111111112.0
+        assert generate_filename("gen", "png", use_timestamp=True) == "gen_1111111112.png"